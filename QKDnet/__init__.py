@@ -1,5 +1,5 @@
 from .components import Network, Controller
 from .protocols import *
 from .quantum import *
-from .request import Request
+from .request import Request, RequestBatch
 from .sim import Simulation
\ No newline at end of file
@@ -14,41 +14,43 @@ class SimpleAllocator(Allocator):
         Args:
             requests (list): Lista de requests.
         """
+        logger = Logger.get_instance()
+        
+        # Remove as requisições que expiraram (prazo vencido), sem percorrer toda a fila
+        for r in self.controller.deadlines.pop_due(self.controller.time):
+            if logger.enabled():
+                logger.log(f"Request: {r.num_id} - Expirou!")
+            self.controller.data_base.collect_failed_requests_data(r)
+            self.controller.finish_request(r)
         
         # Itera sobre as requisições
         for r in self.controller.requests.copy():
             
-            # Se a requisição expirou, remove da lista de requisições
-            if r.time_left == 0:
-                Logger.get_instance().log(f"Request: {r.num_id} - Expirou!")
-                r.finished = True
-                self.controller.data_base.collect_failed_requests_data(r)
-                self.controller.requests.remove(r)
-                continue
-            
-            # Calcula as rotas de menor custo para a request
+            # Rotas da request, da de menor custo para a de maior (já calculadas em `prepare_requests`)
             routes = self.controller.path_finder.get_paths(r.alice, r.bob)
             
-            Logger.get_instance().log(f"Request: {r.num_id} - Rotas: {routes}")
-            
             # Itera sobre as rotas
             for route in routes:
-                # Lista de pares de elementos adjacentes da lista route (canais)
-                route_links = [(route[i], route[i + 1]) for i in range(len(route) - 1)]
+                channels = self.controller.network.channels
                 
-                Logger.get_instance().log(f"Capacidade da rota {route}: {list(self.controller.network.channels[(link[0], link[1])]['capacity'] for link in route_links)}.")
-                Logger.get_instance().log(f"Load da rota {route}: {list(self.controller.network.channels[(link[0], link[1])]['load'] for link in route_links)}.")
+                if logger.enabled():
+                    logger.log(f"Capacidade da rota {route}: {channels.capacity[route.edge_ids].tolist()}.")
+                    logger.log(f"Load da rota {route}: {channels.load[route.edge_ids].tolist()}.")
                 
                 # Se todos os links da rota tem capacidade maior que a carga atual, aloca a rota
-                if all(self.controller.network.channels[(link[0], link[1])]["capacity"] > self.controller.network.channels[(link[0], link[1])]["load"] for link in route_links):
+                if route.has_capacity():
                     r.route = route
-                    Logger.get_instance().log(f"Request: {r.num_id} - Rota {route}.")
+                    if logger.enabled():
+                        logger.log(f"Request: {r.num_id} - Rota {route}.")
                     
                     self.controller.current_requests.append(r)
-                    Logger.get_instance().log(f"Request: {r.num_id} - Adicionado requests na lista de requests atuais.")
+                    if logger.enabled():
+                        logger.log(f"Request: {r.num_id} - Adicionado requests na lista de requests atuais.")
                     
                     self.controller.network.add_load(route)
-                    Logger.get_instance().log(f"Add Load na rota: {list(self.controller.network.channels[(link[0], link[1])] for link in route_links)}")
+                    if logger.enabled():
+                        logger.log(f"Add Load na rota: {channels.load[route.edge_ids].tolist()}")
                     break
         
-        Logger.get_instance().log(f"Requests escolhidas para alocação: {list(request.num_id for request in self.controller.current_requests)}")
\ No newline at end of file
+        if logger.enabled():
+            logger.log(f"Requests escolhidas para alocação: {list(request.num_id for request in self.controller.current_requests)}")
\ No newline at end of file
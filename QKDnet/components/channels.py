@@ -0,0 +1,130 @@
+from collections.abc import Mapping, MutableMapping
+import numpy as np
+
+class ChannelTable(Mapping):
+    """
+    Armazena os canais (enlaces direcionados) da rede em arrays paralelos indexados por um id inteiro.
+    Notas:
+        O índice `index` traduz o canal (u, v) no seu id;
+        Para manter a compatibilidade, a tabela também se comporta como o antigo dicionário de canais: `channels[(u, v)]["load"]`.
+    """
+    # Nome de cada propriedade do canal -> array que a armazena
+    FIELDS = {
+        "load": "load",
+        "capacity": "capacity",
+        "epr_available": "epr_available",
+        "fidelity_value": "fidelity",
+    }
+
+    def __init__(self, links, capacity, epr_available, fidelity) -> None:
+        self.links = list(links)
+        self._index = None
+        size = len(self.links)
+        # Carga do canal
+        self.load = np.zeros(size, dtype=np.int64)
+        # Capacidade do canal
+        self.capacity = np.full(size, capacity, dtype=np.int64)
+        # EPRs
+        self.epr_available = np.full(size, epr_available, dtype=np.int64)
+        # Fidelidade (somente leitura; alterada apenas por `set_fidelity`)
+        self.fidelity = np.full(size, fidelity, dtype=np.float64)
+        self.fidelity.flags.writeable = False
+        # Incrementada sempre que alguma fidelidade muda, para invalidar valores derivados dela
+        self.version = 0
+
+    def set_fidelity(self, fidelity, ids=None):
+        """
+        Altera a fidelidade dos canais e invalida os valores derivados dela (como a fidelidade guardada nas rotas).
+        O array `fidelity` é somente leitura justamente para que toda alteração passe por aqui.
+
+        Args:
+            fidelity (float or array): Nova fidelidade.
+            ids (array, optional): Ids ou máscara booleana dos canais alterados. Defaults to None (todos os canais).
+        """
+        self.fidelity.flags.writeable = True
+        try:
+            self.fidelity[slice(None) if ids is None else ids] = fidelity
+        finally:
+            self.fidelity.flags.writeable = False
+        self.version += 1
+
+    @property
+    def index(self):
+        """
+        Dicionário canal -> id, montado apenas no primeiro acesso (em redes grandes, só as rotas usadas precisam dele).
+        """
+        if self._index is None:
+            self._index = {link: i for i, link in enumerate(self.links)}
+        return self._index
+
+    @classmethod
+    def from_edges(cls, u, v, capacity, epr_available, fidelity):
+        """
+        Monta a tabela a partir de arrays de arestas não direcionadas. Cada aresta (u[i], v[i]) gera os canais (u, v), de id i,
+        e (v, u), de id i + len(u).
+
+        Args:
+            u, v (array): Extremidades das arestas.
+            capacity, epr_available, fidelity: Valor único ou array com um valor por canal.
+        """
+        links = zip(np.concatenate((u, v)).tolist(), np.concatenate((v, u)).tolist())
+        return cls(links, capacity, epr_available, fidelity)
+
+    def __getitem__(self, link):
+        return ChannelView(self, self.index[link])
+
+    def __iter__(self):
+        return iter(self.links)
+
+    def __len__(self):
+        return len(self.links)
+
+    def __contains__(self, link):
+        return link in self.index
+
+    def __repr__(self):
+        return repr({link: dict(self[link]) for link in self.links})
+
+    def edge_ids(self, route):
+        """
+        Traduz uma rota nos ids dos canais que a compõem.
+
+        Args:
+            route (list): Lista com os nós que compõem a rota: [1, 2, 3, 4...]
+
+        Returns:
+            ids (array): Ids dos canais, na ordem da rota.
+        """
+        index = self.index
+        return np.fromiter((index[link] for link in zip(route[:-1], route[1:])), dtype=np.intp, count=max(len(route) - 1, 0))
+
+
+class ChannelView(MutableMapping):
+    """
+    Visão de um único canal da `ChannelTable` com a interface do antigo dicionário de propriedades.
+    Ler ou escrever uma propriedade acessa diretamente os arrays da tabela.
+    """
+    def __init__(self, table, edge_id) -> None:
+        self.table = table
+        self.edge_id = edge_id
+
+    def __getitem__(self, field):
+        return getattr(self.table, ChannelTable.FIELDS[field])[self.edge_id].item()
+
+    def __setitem__(self, field, value):
+        if field == "fidelity_value":
+            self.table.set_fidelity(value, self.edge_id)
+            return
+        getattr(self.table, ChannelTable.FIELDS[field])[self.edge_id] = value
+
+    def __delitem__(self, field):
+        raise TypeError("As propriedades de um canal não podem ser removidas.")
+
+    def __iter__(self):
+        return iter(ChannelTable.FIELDS)
+
+    def __len__(self):
+        return len(ChannelTable.FIELDS)
+
+    def __repr__(self):
+        return repr(dict(self))
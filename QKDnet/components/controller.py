@@ -1,4 +1,5 @@
 from ..protocols import *
+from ..request import RequestRegistry
 from ..utils import Logger
 from .finder import *
 from .sorter import *
@@ -17,23 +18,37 @@ class Controller():
         self.path_finder = None
         self.sorter = None
         self.allocator = None
+        self.requests = None
         # Definindo os tipos dos elementos
         self.set_sorter('urgency')
         self.set_path_finder('kshortest')
         self.set_allocator('simple')
         self.data_base = DataBase()
+        # Chaves entregues: guardadas nas requisições e/ou gravadas em um arquivo
+        self.store_keys = False
+        self.key_exporter = None
         # Dados
         self.received_requests = []
-        self.requests = []
+        self.requests = RequestQueue(self.sorter)
+        # Requisições ativas, por num_id
+        self.registry = RequestRegistry()
+        # Prazos das requisições, por time slot
+        self.deadlines = CalendarQueue()
+        # Estado da rede e do buscador na última estimativa (ver `preparation_state`)
+        self.prepared_state = None
+        # Requisições da fila cujas chaves que faltam mudaram desde a última estimativa, por id()
+        self.changed_requests = {}
         self.current_requests = []
         self.time = 0
     
-    def set_path_finder(self, routes_calculation_type):
+    def set_path_finder(self, routes_calculation_type, build_table=False, cache_dir=None):
         """
         Define o tipo de cálculo de rotas que o controlador utilizará.
 
         Args:
             routes_calculation_type (str): Tipo de cálculo (shortest, kshortest, all, klength.)
+            build_table (bool, optional): Calcula antecipadamente as rotas de todos os pares de nós. Defaults to False.
+            cache_dir (str, optional): Diretório para gravar/reaproveitar a tabela de rotas em disco. Implica `build_table`. Defaults to None.
         """
         # Calcula as rotas de menor custo
         if routes_calculation_type == 'shortest':
@@ -44,6 +59,27 @@ class Controller():
             self.path_finder = AllPaths(self.network)
         elif routes_calculation_type == 'klength':
             self.path_finder = KLengthPaths(self.network)
+        
+        if build_table or cache_dir is not None:
+            self.path_finder.build_table(cache_dir=cache_dir)
+    
+    def set_store_keys(self, store_keys):
+        """
+        Define se as chaves entregues ficam guardadas (compactadas) nas requisições.
+
+        Args:
+            store_keys (bool): Guarda as chaves.
+        """
+        self.store_keys = store_keys
+    
+    def set_key_exporter(self, key_exporter):
+        """
+        Define um `KeyExporter` que grava as chaves entregues à medida que são obtidas, sem mantê-las em memória.
+
+        Args:
+            key_exporter (KeyExporter): Exportador de chaves. None desativa a exportação.
+        """
+        self.key_exporter = key_exporter
     
     def set_sorter(self, sorter_type):
         """
@@ -62,6 +98,10 @@ class Controller():
             self.sorter = ShortestRouteSorter()
         elif sorter_type == 'longest':
             self.sorter = LongestRouteSorter()
+        
+        # Reordena a fila, se ela já existe
+        if self.requests is not None:
+            self.requests.set_sorter(self.sorter)
     
     def set_allocator(self, allocator):
         """
@@ -91,7 +131,14 @@ class Controller():
             requests (list): Lista de requisições.
         """
         self.received_requests.append(requests)
-        self.requests = requests
+        self.requests = RequestQueue(self.sorter, requests)
+        self.registry = RequestRegistry()
+        self.registry.add(requests)
+        self.deadlines = CalendarQueue()
+        self.changed_requests = {}
+        for request in requests:
+            request.set_deadline(self)
+            self.deadlines.push(request)
     
     def add_current_requests(self, requests):
         """
@@ -113,7 +160,7 @@ class Controller():
             route (list): Lista de nós que compõem a rota.
         """
         route = []
-        route.append(nx.shortest_path(self.network.G, alice, bob))
+        route.append(self.network.graph.shortest_path(alice, bob))
         
         return route
         
@@ -124,21 +171,41 @@ class Controller():
         Args:
             requests (list): Lista de requisições.
         """
+        logger = Logger.get_instance()
         
         # Adiciona as requisições recebidas na lista de requisições
         self.received_requests = requests
-        self.requests.extend(requests)
         self.data_base.collect_all_requests_data(requests)
         
-        Logger.get_instance().log(f"Requisições recebidas pelo Controlador: {list(request.get_info() for request in requests)}")
+        if logger.enabled():
+            logger.log(f"Requisições recebidas pelo Controlador: {list(request.get_info() for request in requests)}")
 
-        # Estima o tempo para atendimento dos requests e define as rotas
-        self.prepare_requests(self.requests)
+        # Estima o tempo para atendimento e define as rotas das novas requisições e das que já estavam na fila e mudaram
+        state = self.preparation_state()
+        if state != self.prepared_state:
+            # A rede ou o buscador mudaram: todas as requisições da fila precisam de novas rotas e estimativas
+            self.prepare_requests(self.requests.copy() + list(requests))
+            self.requests.refresh()
+            self.prepared_state = state
+        else:
+            # Só as requisições que obtiveram chaves mudaram de estimativa, e só elas são reinseridas na fila
+            changed = [request for request in self.changed_requests.values() if request in self.requests]
+            self.prepare_requests(changed + list(requests))
+            for request in changed:
+                self.requests.update(request)
+        self.changed_requests = {}
+        
+        # Insere as novas requisições na fila, que se mantém ordenada
+        self.requests.push(requests)
+        self.registry.add(requests)
         
-        # Ordena as requisições
-        self.requests = self.sorter.sort(self.requests)
+        # Os prazos contam a partir do tempo atual do controlador
+        for request in requests:
+            request.set_deadline(self)
+            self.deadlines.push(request)
 
-        Logger.get_instance().log(f"Requisições ordenadas: {list(request.num_id for request in self.requests)}")
+        if logger.enabled():
+            logger.log(f"Requisições ordenadas: {list(request.num_id for request in self.requests)}")
 
 
     def send_requests(self):
@@ -148,35 +215,50 @@ class Controller():
         Args:
             requests (list): Lista de requisições.
         """
+        logger = Logger.get_instance()
         
         # Enquanto houver requisições na lista de requisições
-        while not all(request.finished for request in self.requests): # fnal do laço remover as requests de current_requests
+        while not self.registry.all_finished(): # fnal do laço remover as requests de current_requests
             # Aloca as rotas de acordo com o tempo de atendimento e atualiza a lista de requisições atuais.
             self.allocator.allocate()
 
-            Logger.get_instance().log(f"Requests sendo atendidas: {list(request.num_id for request in self.current_requests)}")
+            if logger.enabled():
+                logger.log(f"Requests sendo atendidas: {list(request.num_id for request in self.current_requests)}")
 
             for request in self.current_requests:
-                Logger.get_instance().log(f"Request: {request.num_id} - Executando.")
+                if logger.enabled():
+                    logger.log(f"Request: {request.num_id} - Executando.")
 
                 # Executa a aplicação QKD
-                request.protocol.run(self.network, request.route)
+                keep_keys = self.store_keys or self.key_exporter is not None
+                result = request.protocol.run(self.network, request.route, store_keys=keep_keys)
                 # Atualiza o númerp de chaves obtidas
-                request.update_keys(len(request.protocol.shared_key))
+                request.update_keys(result.shared_length)
+                # A estimativa (e a posição na fila) é refeita no próximo recebimento
+                self.changed_requests[id(request)] = request
+                
+                # Guarda a chave entregue (no modo estatístico não há bits, só o tamanho)
+                if result.shared_key is not None:
+                    if self.key_exporter is not None:
+                        self.key_exporter.append(request.num_id, result.shared_key, result.shared_length)
+                    if self.store_keys:
+                        request.add_key_material(result.shared_key, result.shared_length)
 
                 # Coleta de dados
                 self.data_base.collect_protocol_data(request.protocol)
                 
-                Logger.get_instance().log(f"Request: {request.num_id} - Chaves Obtidas: {len(request.protocol.shared_key)}")
-                Logger.get_instance().log(f"Request: {request.num_id} - Chaves necessárias: {request.keys_need}")
+                if logger.enabled():
+                    logger.log(f"Request: {request.num_id} - Chaves Obtidas: {result.shared_length}")
+                    logger.log(f"Request: {request.num_id} - Chaves necessárias: {request.keys_need}")
 
                 if request.keys_need <= 0:
-                    Logger.get_instance().log(f"Request: {request.num_id} - Atendida com sucesso.")
+                    if logger.enabled():
+                        logger.log(f"Request: {request.num_id} - Atendida com sucesso.")
                     request.served = True
                     self.data_base.collect_served_requests_data(request)
-                    request.finished = True
-                    self.requests.remove(request)
-                    Logger.get_instance().log(f"Request: {request.num_id} - Removida da lista de requests.")
+                    self.finish_request(request)
+                    if logger.enabled():
+                        logger.log(f"Request: {request.num_id} - Removida da lista de requests.")
 
                 # "Limpa" a rota da requisição    
                 self.network.remove_load(request.route)
@@ -186,12 +268,23 @@ class Controller():
 
             # Atualiza o tempo de atendimento
             self.update_time()
-            Logger.get_instance().log(f"Tempo atual: {self.time}")
+            if logger.enabled():
+                logger.log(f"Tempo atual: {self.time}")
         
         # Coleta o tempo final
         self.data_base.final_time = self.time
 
 
+    def preparation_state(self):
+        """
+        Estado de que dependem as rotas e os tempos estimados das requisições, além das chaves que faltam.
+        Se ele muda entre dois recebimentos, toda a fila é estimada novamente.
+
+        Returns:
+            state (tuple): Versão da topologia, número de qubits e buscador de rotas (com seus parâmetros).
+        """
+        return (self.network.topology_version, self.network.nqubits, self.path_finder, self.path_finder.parameters())
+    
     def prepare_requests(self, requests):
         """
         Estima o tempo de atendimento para as requisições e define a rota para ela.
@@ -200,18 +293,29 @@ class Controller():
             requests (list): Lista de requisições.
         """
 
+        # Calcula as rotas de todas as requisições de uma vez, agrupadas por origem
+        routes = self.path_finder.get_paths_many((r.alice, r.bob) for r in requests)
+        
         for r in requests:
             # Calcula o tempo estimado de atendimento
             estimated_time = 1 + r.keys_need / (self.network.nqubits * r.protocol.sucess_rate)
             # Atualiza o tempo estimado de atendimento
             r.set_times(estimated_time)
             # Define a rotas para a requisição
-            r.set_route(self.path_finder.get_paths(r.alice, r.bob))
+            r.set_route(routes[(r.alice, r.bob)])
+    
+    def finish_request(self, request):
+        """
+        Encerra uma requisição (atendida ou expirada): marca como encerrada e retira da fila e do registro.
+
+        Args:
+            request (Request): Requisição.
+        """
+        self.registry.finish(request)
+        self.requests.remove(request)
     
     def update_time(self):
         """
-        Atualiza o tempo de atendimento para as requisições e do controlador.
+        Atualiza o tempo do controlador. O tempo restante das requisições é derivado deste relógio.
         """
-        self.time += 1
-        for request in self.requests:
-            request.update_time()
\ No newline at end of file
+        self.time += 1
\ No newline at end of file
@@ -5,15 +5,95 @@ class AllPaths(PathFinder):
         super().__init__()
         self.name = "All paths"
         self.network = network
-        
-    def get_paths(self, alice, bob):
+        # Número máximo de rotas. None retorna todas as rotas dentro do limite de saltos
+        self.max_paths = 10
+        # Número máximo de saltos de uma rota. None usa o comprimento da rota mais curta + `extra_hops`
+        self.max_hops = None
+        # Saltos além da rota mais curta aceitos quando `max_hops` é None. None não limita
+        self.extra_hops = 2
+
+    def parameters(self):
+        return (self.max_paths, self.max_hops, self.extra_hops)
+
+    def generate_paths(self, alice, bob):
+        """
+        Gera as rotas simples entre dois nós em ordem não decrescente de comprimento, com uma única DFS limitada.
+        Com `max_paths`, `max_hops` e `extra_hops` iguais a None, todas as rotas simples são enumeradas (custo exponencial).
+        Ramos que não alcançam o destino dentro do limite de saltos são podados pela distância (BFS) até o destino, e o limite
+        diminui assim que as `max_paths` rotas mais curtas de um comprimento em diante estão garantidas.
+
+        Args:
+            alice, bob (node): Nós do grafo da rede.
+
+        Returns:
+            paths (list): Listas de nós que compõem as rotas, respeitando `max_paths` e `max_hops`.
+        """
+        graph = self.network.graph
+        # Distância de cada nó até bob
+        distance = graph.distances(bob, cutoff=self.max_hops)
+        if alice not in distance:
+            return []
+
+        if self.max_hops is not None:
+            bound = self.max_hops
+        elif self.extra_hops is not None:
+            bound = distance[alice] + self.extra_hops
+        else:
+            # Sem limite: uma rota simples tem no máximo n - 1 saltos
+            bound = graph.number_of_nodes() - 1
+        # Rotas encontradas, separadas pelo número de saltos (cada grupo na ordem da DFS)
+        found = [[] for _ in range(bound + 1)]
+
+        path = [alice]
+        visited = {alice}
+        neighbors = [iter(graph.neighbors(alice))]
+
+        while neighbors:
+            neighbor = next(neighbors[-1], visited)
+            # Vizinhos esgotados: volta um nó
+            if neighbor is visited:
+                neighbors.pop()
+                visited.discard(path.pop())
+                continue
+
+            # Saltos até o vizinho
+            hops = len(path)
+            # Garante que o vizinho não esteja no caminho atual e que ainda alcance o destino dentro do limite
+            if neighbor in visited or hops + distance.get(neighbor, bound + 1) > bound:
+                continue
+
+            if neighbor == bob:
+                found[hops].append(path + [neighbor])
+                bound = self.tighten(found, hops, bound)
+                continue
+
+            path.append(neighbor)
+            visited.add(neighbor)
+            neighbors.append(iter(graph.neighbors(neighbor)))
+
+        return [path for paths in found for path in paths][:self.max_paths]
+
+    def tighten(self, found, hops, bound):
         """
-        Procura a todas as rotas.
-        
+        Atualiza o limite de saltos depois de encontrar uma rota com `hops` saltos.
+        Se já há `max_paths` rotas com até `hops` saltos, rotas novas com `hops` saltos ou mais seriam descartadas
+        (a DFS as encontraria depois das que já estão no grupo), então o limite passa a ser `hops - 1`.
+        """
+        if self.max_paths is None or hops > bound:
+            return bound
+
+        if sum(len(paths) for paths in found[:hops + 1]) >= self.max_paths:
+            return hops - 1
+        return bound
+
+    def calculate_paths(self, alice, bob):
+        """
+        Procura as rotas simples mais curtas, até `max_paths` rotas com no máximo `max_hops` saltos.
+
         Args:
             alice, bob (node): Nós do grafo da rede.
 
         Returns:
-            route (list): Lista de listas de nós que compõem a rota.
+            routes (tuple): Tupla de `Route`, da mais curta para a mais longa.
         """
-        return sorted(list(nx.all_simple_paths(self.network.G, alice, bob)), key=len)
\ No newline at end of file
+        return self.to_routes(self.generate_paths(alice, bob))
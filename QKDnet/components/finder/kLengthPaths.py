@@ -1,51 +1,84 @@
 from .pathFinder import *
+from itertools import islice
 
 class KLengthPaths(PathFinder):
     def __init__(self, network) -> None:
         super().__init__()
         self.name = "Paths of K length"
         self.network = network
+        # Comprimento (em saltos) padrão. None usa o comprimento da rota mais curta entre alice e bob
+        self.length = None
+        # Número máximo de rotas retornadas
+        self.max_paths = 10
         
-    def dfs_paths(self, source, target, length, path=None):
+    def dfs_paths(self, source, target, length, distance=None):
         """
-        Realiza uma busca em profundidade (DFS) em busca de caminhos de um comprimento específico entre dois nós.
+        Realiza uma busca em profundidade (DFS) iterativa em busca de caminhos de um comprimento específico entre dois nós.
+        Ramos que não conseguem mais alcançar o destino com os saltos restantes são podados pela distância (BFS) até o destino.
 
         Args:
             source (node): Nó de origem.
             target (node): Nó de destino.
-            length (int): Comprimento desejado do caminho.
-            path (list, optional): Caminho parcial atual. Defaults to None.
+            length (int): Comprimento desejado do caminho (número de nós).
+            distance (dict, optional): Distância (em saltos) de cada nó até target, calculada com limite >= length - 1. Defaults to None (calcula).
 
         Return:
-            list: Lista de nós que compõem um caminho de comprimento específico entre source e target.
+            generator: Listas de nós que compõem um caminho de comprimento específico entre source e target, geradas sob demanda.
         """
-        G = self.network.G
-         # Inicializa o caminho se não estiver definido
-        if path is None:
-            path = [source]
-        # Verifica se o comprimento do caminho atingiu o objetivo
-        if len(path) == length:
-            if path[-1] == target:
-                yield path
+        graph = self.network.graph
+        hops = length - 1
+        # Distância de cada nó até o destino, limitada ao número de saltos
+        if distance is None:
+            distance = graph.distances(target, cutoff=hops)
+        if distance.get(source, length) > hops:
             return
-        # Explora os vizinhos do nó de origem
-        for neighbor in G.neighbors(source):
-            # Garante que o vizinho não esteja no caminho atual
-            if neighbor not in path:
-                # Recursivamente busca caminhos a partir do vizinho
-                yield from self.dfs_paths(neighbor, target, length, path + [neighbor])
+        
+        path = [source]
+        visited = {source}
+        neighbors = [iter(graph.neighbors(source))]
+        
+        while neighbors:
+            neighbor = next(neighbors[-1], visited)
+            # Vizinhos esgotados: volta um nó
+            if neighbor is visited:
+                neighbors.pop()
+                visited.discard(path.pop())
+                continue
+            
+            # Saltos que ainda restam depois de ir para o vizinho
+            remaining = hops - len(path)
+            # Garante que o vizinho não esteja no caminho atual e que ainda alcance o destino
+            if neighbor in visited or distance.get(neighbor, length) > remaining:
+                continue
+            
+            if neighbor == target:
+                if remaining == 0:
+                    yield path + [neighbor]
+                continue
+            
+            path.append(neighbor)
+            visited.add(neighbor)
+            neighbors.append(iter(graph.neighbors(neighbor)))
     
-    def get_paths(self, alice, bob, length):
+    def parameters(self):
+        return (self.length, self.max_paths)
+    
+    def calculate_paths(self, alice, bob, length=None):
         """
-        Encontra todos os caminhos de um comprimento específico entre dois nós.
+        Encontra os caminhos de um comprimento específico entre dois nós, até `max_paths` caminhos.
 
         Args:
             alice (node): Nó de origem.
             bob (node): Nó de destino.
-            length (int): Comprimento desejado do caminho.
+            length (int, optional): Comprimento desejado do caminho (em saltos). Defaults to None (usa `self.length`).
 
         Returns:
             list: Lista de caminhos entre source e target com o comprimento especificado.
         """
-         # Chama a função de busca em profundidade com comprimento + 1 porque length inclui o nó de origem
-        return list(self.dfs_paths(alice, bob, length + 1))
\ No newline at end of file
+        if length is None:
+            length = self.length
+        if length is None:
+            length = self.network.graph.shortest_path_length(alice, bob)
+        
+        # Chama a função de busca em profundidade com comprimento + 1 porque length inclui o nó de origem
+        return self.to_routes(islice(self.dfs_paths(alice, bob, length + 1), self.max_paths))
@@ -8,7 +8,7 @@ class KShortestPaths(PathFinder):
         self.network = network
         self.k = 5
         
-    def get_paths(self, alice, bob):
+    def calculate_paths(self, alice, bob):
         """
         Procura k rotas de menor custo. Para o caso de redes do tipo malha, é mais efetivo que `calculate_shortest_routes()`, já que esta retorna apenas as rotas do canal direto alice-bob.
         Args:
@@ -17,4 +17,7 @@ class KShortestPaths(PathFinder):
         Returns:
             route (list): Lista com k listas de nós que compõem a rota
         """
-        return list(islice(nx.shortest_simple_paths(self.network.G, alice, bob, weight=None), self.k ))
\ No newline at end of file
+        return self.to_routes(islice(self.network.graph.shortest_simple_paths(alice, bob), self.k))
+    
+    def parameters(self):
+        return (self.k,)
\ No newline at end of file
@@ -1,14 +1,193 @@
 from abc import ABC, abstractmethod
+import os
 import networkx as nx
+from .pathTable import PathTable, fingerprint
 
 class PathFinder(ABC):
     """
     Busca as rotas para o controlador.
+    Notas:
+        As rotas calculadas ficam guardadas em uma tabela, por (alice, bob, parâmetros do buscador);
+        A tabela pode ser gravada em disco e reaproveitada por outros processos com a mesma topologia (`build_table(cache_dir=...)`);
+        A tabela é descartada sempre que a rede reconstrói a topologia ou os canais.
     """
     def __init__(self) -> None:
         self.network = None
         self.nome = None
+        self.use_cache = True
+        self.cache = {}
+        self.cache_version = None
+        self.table = None
+    
+    def get_paths(self, alice, bob, *args):
+        """
+        Retorna as rotas entre dois nós, calculando-as apenas na primeira consulta.
+
+        Args:
+            alice, bob (node): Nós do grafo da rede.
+            *args: Argumentos extras do buscador.
+
+        Returns:
+            routes (tuple): Tupla de `Route`. A mesma tupla é devolvida a todas as consultas do par, por isso é imutável.
+        """
+        if not self.use_cache:
+            return self.calculate_paths(alice, bob, *args)
+        
+        self.check_cache()
+        routes = self.lookup(alice, bob, args)
+        
+        if routes is None:
+            routes = self.calculate_paths(alice, bob, *args)
+            self.cache[self.cache_key(alice, bob, args)] = routes
+        
+        return routes
+    
+    def get_paths_many(self, pairs):
+        """
+        Retorna as rotas de vários pares de nós. Os pares que ainda não estão na tabela são agrupados por origem,
+        e cada origem com mais de um destino é resolvida de uma vez por `calculate_paths_from`; um único destino usa a busca
+        por par (`calculate_paths`), mais barata que uma busca a partir da origem.
+
+        Args:
+            pairs (iterable): Pares (alice, bob).
+
+        Returns:
+            routes (dict): Dicionário {(alice, bob): tupla de `Route`}.
+        """
+        if self.use_cache:
+            self.check_cache()
+        
+        results = {}
+        targets_by_source = {}
+        
+        for alice, bob in pairs:
+            if (alice, bob) in results:
+                continue
+            routes = self.lookup(alice, bob) if self.use_cache else None
+            if routes is None:
+                targets_by_source.setdefault(alice, []).append(bob)
+                # Reserva a posição para não repetir o par
+                results[(alice, bob)] = None
+            else:
+                results[(alice, bob)] = routes
+        
+        for alice, targets in targets_by_source.items():
+            if len(targets) == 1:
+                paths = {targets[0]: self.calculate_paths(alice, targets[0])}
+            else:
+                paths = self.calculate_paths_from(alice, targets)
+            
+            for bob, routes in paths.items():
+                results[(alice, bob)] = routes
+                if self.use_cache:
+                    self.cache[self.cache_key(alice, bob)] = routes
+        
+        return results
+    
+    def calculate_paths_from(self, alice, targets):
+        """
+        Calcula as rotas de uma origem para vários destinos. Os buscadores que conseguem reaproveitar uma única busca
+        a partir da origem sobrescrevem este método; por padrão, cada destino é calculado separadamente.
+
+        Args:
+            alice (node): Nó de origem.
+            targets (list): Nós de destino.
+
+        Returns:
+            routes (dict): Dicionário {bob: tupla de `Route`}.
+        """
+        return {bob: self.calculate_paths(alice, bob) for bob in targets}
+    
+    def lookup(self, alice, bob, args=()):
+        """
+        Procura as rotas de um par na tabela em memória e, em seguida, na tabela gravada em disco.
+
+        Returns:
+            routes (tuple): Tupla de `Route`, ou None se o par ainda não foi calculado.
+        """
+        key = self.cache_key(alice, bob, args)
+        routes = self.cache.get(key)
+        
+        if routes is None and self.table is not None and not args:
+            paths = self.table.get(alice, bob)
+            if paths is not None:
+                routes = self.to_routes(paths)
+                self.cache[key] = routes
+        
+        return routes
+    
+    def cache_key(self, alice, bob, args=()):
+        """
+        Chave da tabela de rotas para um par de nós.
+        """
+        return (alice, bob, self.parameters(), args)
+    
+    def parameters(self):
+        """
+        Parâmetros do buscador que alteram as rotas encontradas. Fazem parte da chave da tabela.
+        """
+        return ()
+    
+    def check_cache(self):
+        """
+        Descarta a tabela de rotas se a rede mudou desde que ela foi construída.
+        """
+        if self.cache_version != self.network.topology_version:
+            self.cache.clear()
+            self.table = None
+            self.cache_version = self.network.topology_version
+    
+    def clear_cache(self):
+        """
+        Descarta a tabela de rotas.
+        """
+        self.cache.clear()
+        self.table = None
+    
+    def build_table(self, pairs=None, cache_dir=None):
+        """
+        Calcula antecipadamente as rotas de todos os pares de nós.
+
+        Args:
+            pairs (iterable, optional): Pares (alice, bob). Defaults to None (todos os pares de nós distintos).
+            cache_dir (str, optional): Diretório com as tabelas gravadas em disco. Se já existir uma tabela para esta topologia,
+                estas configurações e estes pares, ela é mapeada em memória ao invés de recalculada; senão, a tabela calculada é gravada.
+                Defaults to None.
+        """
+        self.check_cache()
+        nodes = list(self.network.G.nodes)
+        
+        if pairs is not None:
+            pairs = list(pairs)
+        
+        if cache_dir is not None:
+            # Uma tabela parcial é identificada também pelos seus pares, para não ser confundida com a tabela completa
+            file_name = os.path.join(cache_dir, f"paths-{fingerprint(self.network.G, self, pairs)}.npy")
+            if os.path.exists(file_name):
+                self.table = PathTable.load(file_name, nodes)
+                return
+        
+        if pairs is None:
+            pairs = ((alice, bob) for alice in nodes for bob in nodes if alice != bob)
+        
+        paths_by_pair = self.get_paths_many(pairs)
+        
+        if cache_dir is not None:
+            # Grava apenas os pares pedidos, mesmo que a tabela em memória tenha outros
+            PathTable.from_paths(paths_by_pair, nodes).save(file_name)
+    
+    def to_routes(self, paths):
+        """
+        Converte listas de nós nas `Route` internadas da rede.
+
+        Args:
+            paths (iterable): Listas de nós que compõem as rotas.
+
+        Returns:
+            routes (tuple): Tupla de `Route`.
+        """
+        return tuple(self.network.get_route(path) for path in paths)
     
     @abstractmethod
-    def get_paths(self):
+    def calculate_paths(self):
         pass
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import numpy as np
+
+class PathTable():
+    """
+    Tabela de rotas serializada em um único array int64, gravado como `.npy` e lido com mapeamento em memória.
+    Notas:
+        Os nós são guardados pelo seu índice em `list(G.nodes)`;
+        Layout: [n_pares, n_rotas, chaves dos pares (alice * n_nós + bob, ordenadas), início das rotas de cada par, início dos nós de cada rota, nós].
+    """
+    def __init__(self, data, nodes) -> None:
+        self.data = data
+        self.nodes = nodes
+        n_pairs, n_paths = int(data[0]), int(data[1])
+        start = 2
+        self.keys = data[start:start + n_pairs]
+        start += n_pairs
+        self.pair_offsets = data[start:start + n_pairs + 1]
+        start += n_pairs + 1
+        self.path_offsets = data[start:start + n_paths + 1]
+        start += n_paths + 1
+        self.entries = data[start:]
+        self.node_index = {node: i for i, node in enumerate(nodes)}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def get(self, alice, bob):
+        """
+        Procura as rotas de um par de nós.
+
+        Args:
+            alice, bob (node): Nós do grafo da rede.
+
+        Returns:
+            paths (list): Lista de tuplas de nós, ou None se o par não está na tabela.
+        """
+        if alice not in self.node_index or bob not in self.node_index:
+            return None
+
+        key = self.node_index[alice] * len(self.nodes) + self.node_index[bob]
+        position = np.searchsorted(self.keys, key)
+        if position == len(self.keys) or self.keys[position] != key:
+            return None
+
+        paths = []
+        for path in range(self.pair_offsets[position], self.pair_offsets[position + 1]):
+            indices = self.entries[self.path_offsets[path]:self.path_offsets[path + 1]]
+            paths.append(tuple(self.nodes[i] for i in indices))
+
+        return paths
+
+    @classmethod
+    def from_paths(cls, paths_by_pair, nodes):
+        """
+        Monta a tabela a partir de um dicionário {(alice, bob): rotas}.
+
+        Args:
+            paths_by_pair (dict): Rotas (listas de nós) de cada par.
+            nodes (list): Nós da rede, na ordem de `G.nodes`.
+        """
+        node_index = {node: i for i, node in enumerate(nodes)}
+        pairs = sorted(paths_by_pair, key=lambda pair: node_index[pair[0]] * len(nodes) + node_index[pair[1]])
+
+        keys, pair_offsets, path_offsets, entries = [], [0], [0], []
+        for alice, bob in pairs:
+            keys.append(node_index[alice] * len(nodes) + node_index[bob])
+            for path in paths_by_pair[(alice, bob)]:
+                entries.extend(node_index[node] for node in path)
+                path_offsets.append(len(entries))
+            pair_offsets.append(len(path_offsets) - 1)
+
+        data = np.array([len(keys), len(path_offsets) - 1] + keys + pair_offsets + path_offsets + entries, dtype=np.int64)
+        return cls(data, nodes)
+
+    def save(self, file_name):
+        """
+        Grava a tabela. A escrita é atômica, então processos simultâneos nunca leem um arquivo incompleto.
+
+        Args:
+            file_name (str): Caminho do arquivo `.npy`.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(file_name)), exist_ok=True)
+        temporary = f"{file_name}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            np.save(file, self.data)
+        os.replace(temporary, file_name)
+
+    @classmethod
+    def load(cls, file_name, nodes):
+        """
+        Lê uma tabela gravada, mapeando o arquivo em memória.
+
+        Args:
+            file_name (str): Caminho do arquivo `.npy`.
+            nodes (list): Nós da rede, na ordem de `G.nodes`.
+        """
+        return cls(np.load(file_name, mmap_mode="r"), nodes)
+
+
+def fingerprint(G, finder, pairs=None):
+    """
+    Gera uma identificação da topologia, das configurações do buscador de rotas e dos pares da tabela.
+
+    Args:
+        G (Graph): Grafo da rede.
+        finder (PathFinder): Buscador de rotas.
+        pairs (list, optional): Pares (alice, bob) de uma tabela parcial. Defaults to None (todos os pares).
+
+    Returns:
+        str: Hash hexadecimal.
+    """
+    # A ordem dos pares não muda a tabela
+    pairs = None if pairs is None else sorted(set(pairs), key=repr)
+    description = repr((list(G.nodes), list(G.edges), type(finder).__name__, finder.parameters(), finder.network.backend, pairs))
+    return hashlib.sha1(description.encode()).hexdigest()
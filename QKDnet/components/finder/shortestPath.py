@@ -6,7 +6,7 @@ class ShortestPath(PathFinder):
         self.name = "Shortest path"
         self.network = network
         
-    def get_paths(self, alice, bob):
+    def calculate_paths(self, alice, bob):
         """
         Procura a rota de menor custo.
         
@@ -14,9 +14,20 @@ class ShortestPath(PathFinder):
             alice, bob (node): Nós do grafo da rede.
 
         Returns:
-            route (list): Lista de nós que compõem a rota.
+            route (tuple): Tupla com a `Route`.
         """
-        route = []
-        route.append(nx.shortest_path(self.network.G, alice, bob))
+        return self.to_routes([self.network.graph.shortest_path(alice, bob)])
+    
+    def calculate_paths_from(self, alice, targets):
+        """
+        Procura a rota de menor custo de alice para cada destino com uma única busca em largura.
         
-        return route
\ No newline at end of file
+        Args:
+            alice (node): Nó de origem.
+            targets (list): Nós de destino.
+
+        Returns:
+            routes (dict): Dicionário {bob: tupla com a `Route`}.
+        """
+        paths = self.network.graph.shortest_paths_from(alice, targets)
+        return {bob: self.to_routes([path]) for bob, path in paths.items()}
@@ -6,7 +6,7 @@ class ShortestPaths(PathFinder):
         self.name = "Shortest paths"
         self.network = network
         
-    def get_paths(self, alice, bob):
+    def calculate_paths(self, alice, bob):
         """
         Procura as rotas de menores custos.
         
@@ -14,7 +14,21 @@ class ShortestPaths(PathFinder):
             alice, bob (node): Nós do grafo da rede.
 
         Returns:
-            route (list): Lista de nós que compõem a rota.
+            routes (tuple): Tupla de `Route`.
         """
-        return list(nx.all_shortest_paths(self.network.G, alice, bob))
-    
\ No newline at end of file
+        return self.to_routes(self.network.graph.all_shortest_paths(alice, bob))
+    
+    def calculate_paths_from(self, alice, targets):
+        """
+        Procura as rotas de menores custos de alice para cada destino. A busca em largura a partir de alice é
+        reaproveitada por todos os destinos.
+        
+        Args:
+            alice (node): Nó de origem.
+            targets (list): Nós de destino.
+
+        Returns:
+            routes (dict): Dicionário {bob: tupla de `Route`}.
+        """
+        paths = self.network.graph.all_shortest_paths_from(alice, targets)
+        return {bob: self.to_routes(paths[bob]) for bob in targets}
@@ -0,0 +1,156 @@
+import random
+import numpy as np
+from ..utils import sparse_flip_indices
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+# Funções que geram topologias sintéticas diretamente como arrays de arestas.
+# Os nós são os inteiros 0..num_nodes-1, posicionados no quadrado unitário; cada aresta (u[i], v[i]) aparece uma única vez, com u < v.
+
+def random_positions(num_nodes):
+    """
+    Sorteia as posições dos nós no quadrado unitário.
+
+    Returns:
+        positions (array): Array (num_nodes, 2) com as coordenadas dos nós.
+    """
+    return np.random.random((num_nodes, 2))
+
+def edge_lengths(positions, u, v):
+    """
+    Calcula a distância euclidiana de cada aresta.
+    """
+    return np.hypot(*(positions[u] - positions[v]).T)
+
+def largest_component(num_nodes, u, v):
+    """
+    Encontra a maior componente conexa por propagação do menor rótulo, com saltos de ponteiro (label = label[label]).
+    Cada nó termina com o menor índice da sua componente.
+
+    Returns:
+        mask (array): Máscara bool com os nós da maior componente.
+    """
+    label = np.arange(num_nodes)
+    while True:
+        previous = label
+        label = label.copy()
+        np.minimum.at(label, u, label[v])
+        np.minimum.at(label, v, label[u])
+        label = label[label]
+        if np.array_equal(label, previous):
+            break
+    
+    roots, counts = np.unique(label, return_counts=True)
+    return label == roots[np.argmax(counts)]
+
+def keep_largest_component(positions, u, v):
+    """
+    Restringe uma topologia sintética à sua maior componente conexa, renumerando os nós restantes de 0 em diante.
+    Em grafos de Waxman e geométricos esparsos há nós isolados e ilhas, e pares de nós em componentes diferentes não têm rota.
+
+    Returns:
+        positions, u, v (array): Coordenadas dos nós mantidos e extremidades das arestas, com os novos índices.
+    """
+    mask = largest_component(len(positions), u, v)
+    if mask.all():
+        return positions, u, v
+    
+    index = np.cumsum(mask) - 1
+    # As duas extremidades de uma aresta estão sempre na mesma componente
+    keep = mask[u]
+    return positions[mask], index[u[keep]], index[v[keep]]
+
+def distance_fidelity(lengths, fidelity, length_scale):
+    """
+    Fidelidade de canais com os comprimentos dados. A fidelidade decai exponencialmente com a distância, de `fidelity`
+    (canal de comprimento zero) até 0.5 (canal totalmente despolarizado).
+
+    Args:
+        lengths (array): Comprimento de cada canal.
+        fidelity (float): Fidelidade de um canal de comprimento zero.
+        length_scale (float): Comprimento em que o excesso de fidelidade sobre 0.5 cai a 1/e.
+
+    Returns:
+        fidelities (array): Fidelidade de cada canal.
+    """
+    return 0.5 + (fidelity - 0.5) * np.exp(-lengths / length_scale)
+
+def random_geometric_edges(positions, radius):
+    """
+    Grafo geométrico aleatório: liga todos os pares de nós a uma distância menor ou igual a `radius`.
+
+    Returns:
+        u, v (array): Extremidades das arestas.
+    """
+    if cKDTree is None:
+        raise ImportError("O gerador de grafos geométricos aleatórios requer o scipy.")
+
+    pairs = cKDTree(positions).query_pairs(radius, output_type="ndarray")
+    return pairs[:, 0], pairs[:, 1]
+
+def waxman_edges(positions, alpha=0.4, beta=0.1):
+    """
+    Grafo de Waxman: cada par de nós é ligado com probabilidade beta * exp(-d / (alpha * L)), onde L é a maior distância possível.
+    Os pares candidatos são sorteados com probabilidade beta por saltos geométricos e só então aceitos pela distância,
+    então o custo acompanha beta * n² / 2 ao invés de n² / 2.
+
+    Args:
+        positions (array): Coordenadas dos nós.
+        alpha (float): Controla o alcance das arestas.
+        beta (float): Controla a densidade de arestas.
+
+    Returns:
+        u, v (array): Extremidades das arestas.
+    """
+    n = len(positions)
+    candidates = sparse_flip_indices(n * (n - 1) // 2, beta)
+    u, v = pair_from_index(candidates, n)
+    keep = np.random.random(len(u)) < np.exp(-edge_lengths(positions, u, v) / (alpha * np.sqrt(2)))
+    return u[keep], v[keep]
+
+def pair_from_index(k, n):
+    """
+    Traduz a posição k de um par (u, v), u < v, na enumeração linha a linha do triângulo superior de uma matriz n x n.
+    """
+    # Início da linha u na enumeração
+    def offset(u):
+        return u * (2 * n - u - 1) // 2
+    
+    u = ((2 * n - 1 - np.sqrt((2 * n - 1) ** 2 - 8 * k.astype(np.float64))) // 2).astype(np.int64)
+    # Corrige os erros de arredondamento da raiz
+    u -= offset(u) > k
+    u += offset(u + 1) <= k
+    return u, k - offset(u) + u + 1
+
+def barabasi_albert_edges(num_nodes, m):
+    """
+    Grafo de Barabási–Albert: cada novo nó se liga a m nós distintos, escolhidos com probabilidade proporcional ao grau.
+    A semente é uma estrela com m + 1 nós (o nó 0 ligado aos nós 1..m), como no `nx.barabasi_albert_graph`.
+
+    Returns:
+        u, v (array): Extremidades das arestas.
+    """
+    if m < 1 or m >= num_nodes:
+        raise ValueError(f"O Barabási–Albert requer 1 <= m < num_nodes (m = {m}, num_nodes = {num_nodes}).")
+
+    # Estrela inicial
+    u, v = [0] * m, list(range(1, m + 1))
+    # Cada nó aparece uma vez por aresta que toca, então sortear uma posição é sortear proporcionalmente ao grau
+    repeated = u + v
+    
+    for node in range(m + 1, num_nodes):
+        # Sorteia m alvos distintos para o novo nó
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(repeated[int(random.random() * len(repeated))])
+        targets = list(chosen)
+        
+        u.extend(targets)
+        v.extend([node] * m)
+        repeated.extend(targets)
+        repeated.extend([node] * m)
+    
+    return np.array(u, dtype=np.int64), np.array(v, dtype=np.int64)
@@ -0,0 +1,3 @@
+from .graphBackend import GraphBackend
+from .networkxBackend import NetworkxBackend
+from .csrBackend import CSRBackend
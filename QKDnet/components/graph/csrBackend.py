@@ -0,0 +1,229 @@
+import heapq
+import networkx as nx
+import numpy as np
+from .graphBackend import GraphBackend
+
+try:
+    from scipy.sparse import csr_matrix, csgraph
+except ImportError:
+    csr_matrix = csgraph = None
+
+class CSRBackend(GraphBackend):
+    """
+    Backend para topologias grandes: o grafo é convertido em uma matriz de adjacência esparsa (CSR) sobre ids inteiros,
+    e as buscas em largura a partir de uma origem são feitas pelo `scipy.sparse.csgraph`.
+    Notas:
+        O id de um nó é a sua posição em `list(G.nodes)`;
+        As rotas têm o mesmo comprimento que as do networkx, mas, entre rotas de mesmo comprimento, a escolhida pode ser outra;
+        Requer o scipy.
+    """
+    def __init__(self, G) -> None:
+        if csgraph is None:
+            raise ImportError("O backend 'csr' requer o scipy.")
+        
+        super().__init__(G)
+        self.name = "csr"
+        self.nodes = list(G.nodes)
+        self.node_index = {node: i for i, node in enumerate(self.nodes)}
+        # Array de objetos para traduzir vários ids em rótulos de uma vez
+        self.labels = np.empty(len(self.nodes), dtype=object)
+        self.labels[:] = self.nodes
+        
+        n = len(self.nodes)
+        index = self.node_index
+        edges = np.fromiter((index[node] for edge in G.edges for node in edge), dtype=np.intp, count=2 * G.number_of_edges())
+        u, v = edges[0::2], edges[1::2]
+        rows, cols = np.concatenate((u, v)), np.concatenate((v, u))
+        
+        self.matrix = csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n))
+        self.matrix.sum_duplicates()
+        self.matrix.data[:] = 1
+        self.indptr = self.matrix.indptr
+        self.indices = self.matrix.indices
+        # Linha (nó de origem) de cada entrada da matriz
+        self.rows = np.repeat(np.arange(n), np.diff(self.indptr))
+        self._adjacency = None
+    
+    def number_of_nodes(self):
+        return len(self.nodes)
+    
+    def neighbors(self, node):
+        i = self.node_index[node]
+        return self.labels[self.indices[self.indptr[i]:self.indptr[i + 1]]]
+    
+    def bfs(self, source):
+        """
+        Busca em largura a partir do id source.
+
+        Returns:
+            pred (array): Predecessor de cada id na árvore de busca (negativo se não há).
+        """
+        return csgraph.breadth_first_order(self.matrix, source, directed=True, return_predecessors=True)[1]
+    
+    def hop_distances(self, source):
+        """
+        Distância (em saltos) do id source até cada id (-1 se inalcançável).
+        """
+        distance = csgraph.shortest_path(self.matrix, unweighted=True, indices=source)
+        distance[~np.isfinite(distance)] = -1
+        return distance.astype(np.int64)
+    
+    def distances(self, source, cutoff=None):
+        distance = self.hop_distances(self.node_index[source])
+        reached = np.flatnonzero((distance >= 0) if cutoff is None else (distance >= 0) & (distance <= cutoff))
+        return dict(zip(self.labels[reached], distance[reached].tolist()))
+    
+    def path_ids(self, source, target, pred):
+        """
+        Monta a rota (em ids) de source até target seguindo a árvore de predecessores.
+        """
+        if target != source and pred[target] < 0:
+            return None
+        
+        path = [target]
+        while path[-1] != source:
+            path.append(pred[path[-1]])
+        
+        return path[::-1]
+    
+    def shortest_paths_from(self, source, targets):
+        s = self.node_index[source]
+        pred = self.bfs(s)
+        
+        paths = {}
+        for target in targets:
+            path = self.path_ids(s, self.node_index[target], pred)
+            if path is None:
+                raise nx.NetworkXNoPath(f"Target {target} cannot be reached from given sources")
+            paths[target] = self.labels[path].tolist()
+        
+        return paths
+    
+    def all_shortest_paths_from(self, source, targets):
+        s = self.node_index[source]
+        distance = self.hop_distances(s)
+        pred = ShortestPathPredecessors(self, distance)
+        
+        paths = {}
+        for target in targets:
+            t = self.node_index[target]
+            if distance[t] < 0:
+                raise nx.NetworkXNoPath(f"Target {target} cannot be reached from given sources")
+            paths[target] = [self.labels[path].tolist() for path in self.paths_from_predecessors(s, t, pred)]
+        
+        return paths
+    
+    @property
+    def adjacency(self):
+        """
+        Vizinhos (ids) de cada id em listas do Python, montadas no primeiro acesso. As buscas feitas nó a nó em Python
+        (algoritmo de Yen) percorrem essas listas ao invés de fatiar a matriz a cada nó.
+        """
+        if self._adjacency is None:
+            indices, indptr = self.indices.tolist(), self.indptr.tolist()
+            self._adjacency = [indices[start:end] for start, end in zip(indptr[:-1], indptr[1:])]
+        return self._adjacency
+    
+    def bidirectional_path(self, source, target, ignore_nodes=(), ignore_edges=()):
+        """
+        Busca em largura bidirecional de source até target (ids), ignorando os nós e as arestas (nos dois sentidos)
+        informados, como a `_bidirectional_pred_succ` do networkx. As duas buscas avançam pela fronteira menor e param
+        quando se encontram, então só a vizinhança dos dois extremos é percorrida.
+
+        Returns:
+            path (list): Rota de menor custo em ids, ou None se target não é alcançável.
+        """
+        if source == target:
+            return [source]
+        if source in ignore_nodes or target in ignore_nodes:
+            return None
+        
+        adjacency = self.adjacency
+        pred, succ = {source: None}, {target: None}
+        forward, backward = [source], [target]
+        
+        while forward and backward:
+            # Avança a busca com a menor fronteira
+            if len(forward) <= len(backward):
+                frontier, forward = forward, []
+                reached, other, level = pred, succ, forward
+            else:
+                frontier, backward = backward, []
+                reached, other, level = succ, pred, backward
+            
+            for node in frontier:
+                for neighbor in adjacency[node]:
+                    if neighbor in ignore_nodes or (node, neighbor) in ignore_edges or (neighbor, node) in ignore_edges:
+                        continue
+                    if neighbor not in reached:
+                        reached[neighbor] = node
+                        level.append(neighbor)
+                    if neighbor in other:
+                        # As buscas se encontraram: junta o caminho até o encontro com o caminho até target
+                        path = []
+                        while neighbor is not None:
+                            path.append(neighbor)
+                            neighbor = pred[neighbor]
+                        path.reverse()
+                        neighbor = succ[path[-1]]
+                        while neighbor is not None:
+                            path.append(neighbor)
+                            neighbor = succ[neighbor]
+                        return path
+        
+        return None
+    
+    def shortest_simple_paths(self, source, target):
+        s, t = self.node_index[source], self.node_index[target]
+        first = self.bidirectional_path(s, t)
+        if first is None:
+            raise nx.NetworkXNoPath(f"Target {target} cannot be reached from given sources")
+        
+        found = [first]
+        seen = {tuple(first)}
+        # Candidatas por (saltos, ordem de inserção)
+        candidates = []
+        counter = 0
+        
+        while True:
+            yield self.labels[found[-1]].tolist()
+            
+            last = found[-1]
+            # Rotas já encontradas que compartilham a raiz atual, e os nós da raiz antes do nó de desvio
+            sharing = found
+            root_nodes = set()
+            for i in range(len(last) - 1):
+                if i > 0:
+                    root_nodes.add(last[i - 1])
+                sharing = [path for path in sharing if len(path) > i + 1 and path[i] == last[i]]
+                # Remove as arestas que as rotas com a mesma raiz usam a partir do nó de desvio
+                ignore_edges = {(path[i], path[i + 1]) for path in sharing}
+                spur = self.bidirectional_path(last[i], t, root_nodes, ignore_edges)
+                if spur is None:
+                    continue
+                
+                path = last[:i] + spur
+                if tuple(path) not in seen:
+                    seen.add(tuple(path))
+                    heapq.heappush(candidates, (len(path), counter, path))
+                    counter += 1
+            
+            if not candidates:
+                return
+            found.append(heapq.heappop(candidates)[2])
+
+
+class ShortestPathPredecessors(dict):
+    """
+    Predecessores (ids) de cada nó em todas as rotas de menor custo a partir de uma origem, no formato esperado por
+    `GraphBackend.paths_from_predecessors`. Cada entrada é calculada no primeiro acesso, então só os nós percorridos pagam.
+    """
+    def __init__(self, backend, distance) -> None:
+        super().__init__()
+        self.backend = backend
+        self.distance = distance
+
+    def __missing__(self, node):
+        neighbors = self.backend.indices[self.backend.indptr[node]:self.backend.indptr[node + 1]]
+        self[node] = neighbors[self.distance[neighbors] == self.distance[node] - 1].tolist()
+        return self[node]
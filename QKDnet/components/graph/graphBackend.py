@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+
+class GraphBackend(ABC):
+    """
+    Estrutura de grafo usada pelos buscadores de rotas.
+    Notas:
+        Os nós são sempre recebidos e devolvidos com os rótulos do grafo da rede (`G.nodes`);
+        Quando não existe rota entre dois nós, os métodos levantam `nx.NetworkXNoPath`, como o networkx.
+    """
+    def __init__(self, G) -> None:
+        self.G = G
+        self.name = None
+    
+    @abstractmethod
+    def number_of_nodes(self):
+        pass
+    
+    @abstractmethod
+    def neighbors(self, node):
+        """
+        Retorna um iterável com os vizinhos de um nó.
+        """
+        pass
+    
+    @abstractmethod
+    def distances(self, source, cutoff=None):
+        """
+        Calcula a distância (em saltos) de source até cada nó alcançável.
+
+        Args:
+            source (node): Nó de origem.
+            cutoff (int, optional): Distância máxima. Defaults to None (sem limite).
+
+        Returns:
+            distance (dict): Dicionário {nó: distância}.
+        """
+        pass
+    
+    @abstractmethod
+    def shortest_paths_from(self, source, targets):
+        """
+        Procura uma rota de menor custo de source para cada destino, com uma única busca a partir de source.
+
+        Returns:
+            paths (dict): Dicionário {destino: lista de nós}.
+        """
+        pass
+    
+    @abstractmethod
+    def all_shortest_paths_from(self, source, targets):
+        """
+        Procura todas as rotas de menor custo de source para cada destino, com uma única busca a partir de source.
+
+        Returns:
+            paths (dict): Dicionário {destino: lista de listas de nós}.
+        """
+        pass
+    
+    @abstractmethod
+    def shortest_simple_paths(self, source, target):
+        """
+        Gera as rotas simples entre dois nós em ordem não decrescente de comprimento (algoritmo de Yen).
+
+        Returns:
+            generator: Listas de nós que compõem as rotas.
+        """
+        pass
+    
+    def shortest_path(self, source, target):
+        """
+        Procura uma rota de menor custo entre dois nós. Os backends que têm uma busca própria para um único par
+        (ex.: busca bidirecional) sobrescrevem este método e os dois seguintes.
+        """
+        return self.shortest_paths_from(source, [target])[target]
+    
+    def shortest_path_length(self, source, target):
+        """
+        Retorna o número de saltos da rota de menor custo entre dois nós.
+        """
+        return len(self.shortest_path(source, target)) - 1
+    
+    def all_shortest_paths(self, source, target):
+        """
+        Procura todas as rotas de menor custo entre dois nós.
+
+        Returns:
+            paths (list): Listas de nós que compõem as rotas.
+        """
+        return self.all_shortest_paths_from(source, [target])[target]
+    
+    def paths_from_predecessors(self, source, target, pred):
+        """
+        Monta todas as rotas de menor custo percorrendo os predecessores de target até source.
+
+        Args:
+            source, target (node): Nós do grafo da rede.
+            pred (dict): Predecessores de cada nó na busca em largura a partir de source.
+
+        Returns:
+            paths (list): Listas de nós que compõem as rotas.
+        """
+        paths = []
+        stack = [[target]]
+        
+        while stack:
+            path = stack.pop()
+            if path[-1] == source:
+                paths.append(path[::-1])
+                continue
+            for node in reversed(pred[path[-1]]):
+                stack.append(path + [node])
+        
+        return paths
@@ -0,0 +1,48 @@
+import networkx as nx
+from .graphBackend import GraphBackend
+
+class NetworkxBackend(GraphBackend):
+    """
+    Backend de referência: delega as buscas ao networkx, diretamente sobre o grafo da rede.
+    """
+    def __init__(self, G) -> None:
+        super().__init__(G)
+        self.name = "networkx"
+    
+    def number_of_nodes(self):
+        return self.G.number_of_nodes()
+    
+    def neighbors(self, node):
+        return self.G.adj[node]
+    
+    def distances(self, source, cutoff=None):
+        return nx.single_source_shortest_path_length(self.G, source, cutoff=cutoff)
+    
+    def shortest_paths_from(self, source, targets):
+        paths = nx.single_source_shortest_path(self.G, source)
+        for target in targets:
+            if target not in paths:
+                raise nx.NetworkXNoPath(f"Target {target} cannot be reached from given sources")
+        
+        return {target: paths[target] for target in targets}
+    
+    def all_shortest_paths_from(self, source, targets):
+        pred = nx.predecessor(self.G, source)
+        for target in targets:
+            if target not in pred:
+                raise nx.NetworkXNoPath(f"Target {target} cannot be reached from given sources")
+        
+        return {target: self.paths_from_predecessors(source, target, pred) for target in targets}
+    
+    def shortest_path(self, source, target):
+        # Busca bidirecional: para ao encontrar o par, sem percorrer o grafo inteiro
+        return nx.shortest_path(self.G, source, target)
+    
+    def shortest_path_length(self, source, target):
+        return nx.shortest_path_length(self.G, source, target)
+    
+    def all_shortest_paths(self, source, target):
+        return list(nx.all_shortest_paths(self.G, source, target))
+    
+    def shortest_simple_paths(self, source, target):
+        return nx.shortest_simple_paths(self.G, source, target, weight=None)
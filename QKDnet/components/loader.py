@@ -0,0 +1,184 @@
+import os
+import numpy as np
+import networkx as nx
+
+# Leitura de topologias de arquivos (lista de arestas ou GraphML), com cache binário `.npz` ao lado do arquivo.
+# A topologia lida é representada por arrays: rótulos dos nós, extremidades (índices) das arestas e, por aresta,
+# capacidade (-1 quando não informada) e fidelidade (NaN quando não informada).
+# Os rótulos podem misturar inteiros (nós finais) e textos (repetidores, switches), então são guardados em dois arrays,
+# "node_ints" e "node_strs", e "node_is_str" indica qual deles vale para cada nó; `node_labels` os junta de volta.
+
+# Versão do formato do cache; incrementar quando o conteúdo do `.npz` mudar
+CACHE_FORMAT = 2
+# Arrays que compõem a topologia
+FIELDS = ("node_ints", "node_strs", "node_is_str", "u", "v", "capacity", "fidelity")
+
+def parse_label(label):
+    """
+    Converte o rótulo de um nó em inteiro, quando possível, para manter os mesmos rótulos das topologias embutidas.
+    """
+    try:
+        return int(label)
+    except ValueError:
+        return label
+
+def read_edge_list(path):
+    """
+    Lê uma lista de arestas: uma aresta por linha, "u v [capacidade] [fidelidade]", separada por espaços ou vírgulas.
+    Linhas vazias e o que vem depois de "#" são ignorados.
+
+    Returns:
+        nodes, edges, capacity, fidelity: Rótulos dos nós, pares de rótulos e os valores de cada aresta (None quando ausente).
+    """
+    nodes, edges, capacity, fidelity = {}, [], [], []
+
+    with open(path) as file:
+        for line in file:
+            fields = line.split("#", 1)[0].replace(",", " ").split()
+            if not fields:
+                continue
+            if len(fields) < 2:
+                raise ValueError(f"Linha inválida em {path}: {line.strip()}")
+
+            u, v = parse_label(fields[0]), parse_label(fields[1])
+            nodes.setdefault(u, None)
+            nodes.setdefault(v, None)
+            edges.append((u, v))
+            capacity.append(int(fields[2]) if len(fields) > 2 else None)
+            fidelity.append(float(fields[3]) if len(fields) > 3 else None)
+
+    return list(nodes), edges, capacity, fidelity
+
+def read_graphml(path):
+    """
+    Lê um arquivo GraphML. A capacidade e a fidelidade de cada aresta vêm dos atributos "capacity" e "fidelity".
+
+    Returns:
+        nodes, edges, capacity, fidelity: Rótulos dos nós, pares de rótulos e os valores de cada aresta (None quando ausente).
+    """
+    G = nx.read_graphml(path)
+    mapping = {node: parse_label(node) for node in G.nodes}
+    edges, capacity, fidelity = [], [], []
+
+    for u, v, data in G.edges(data=True):
+        edges.append((mapping[u], mapping[v]))
+        capacity.append(int(data["capacity"]) if "capacity" in data else None)
+        fidelity.append(float(data["fidelity"]) if "fidelity" in data else None)
+
+    return [mapping[node] for node in G.nodes], edges, capacity, fidelity
+
+def merge_duplicate_edges(edges, capacity, fidelity):
+    """
+    Junta as arestas repetidas, inclusive as que aparecem nos dois sentidos ("u v" e "v u"), em uma única aresta.
+    Um valor ausente em uma das repetições é completado pela outra.
+
+    Raises:
+        ValueError: Se há um laço (u == v) ou se as repetições de uma aresta informam valores diferentes.
+
+    Returns:
+        edges, capacity, fidelity: Arestas únicas, na ordem da primeira ocorrência, e os seus valores.
+    """
+    merged = {}
+    for (a, b), c, f in zip(edges, capacity, fidelity):
+        if a == b:
+            raise ValueError(f"Laço no nó {a!r}: um canal precisa ligar dois nós distintos.")
+        
+        key = frozenset((a, b))
+        if key not in merged:
+            merged[key] = [(a, b), c, f]
+            continue
+        
+        entry = merged[key]
+        for position, value in ((1, c), (2, f)):
+            if value is None:
+                continue
+            if entry[position] is not None and entry[position] != value:
+                raise ValueError(f"A aresta ({a!r}, {b!r}) aparece repetida com valores diferentes: {entry[position]} e {value}.")
+            entry[position] = value
+    
+    entries = list(merged.values())
+    return [e[0] for e in entries], [e[1] for e in entries], [e[2] for e in entries]
+
+def node_labels(topology):
+    """
+    Junta os rótulos dos nós, mantendo o tipo de cada um (inteiro ou texto).
+
+    Returns:
+        nodes (list): Rótulos dos nós, na ordem dos índices usados em "u" e "v".
+    """
+    ints = topology["node_ints"].tolist()
+    strs = topology["node_strs"].tolist()
+    return [label if is_str else number for number, label, is_str in zip(ints, strs, topology["node_is_str"].tolist())]
+
+def parse_topology(path):
+    """
+    Lê a topologia de um arquivo, escolhendo o formato pela extensão (.graphml ou lista de arestas).
+    Arestas repetidas são juntadas por `merge_duplicate_edges`.
+
+    Returns:
+        topology (dict): Arrays "node_ints", "node_strs", "node_is_str", "u", "v", "capacity" e "fidelity".
+    """
+    if path.lower().endswith(".graphml"):
+        nodes, edges, capacity, fidelity = read_graphml(path)
+    else:
+        nodes, edges, capacity, fidelity = read_edge_list(path)
+
+    edges, capacity, fidelity = merge_duplicate_edges(edges, capacity, fidelity)
+    index = {node: i for i, node in enumerate(nodes)}
+    u = np.fromiter((index[a] for a, _ in edges), dtype=np.int64, count=len(edges))
+    v = np.fromiter((index[b] for _, b in edges), dtype=np.int64, count=len(edges))
+
+    # Cada rótulo vai para o array do seu tipo; a posição no outro array fica com um valor neutro
+    is_str = np.array([isinstance(node, str) for node in nodes], dtype=bool)
+
+    return {
+        "node_ints": np.array([0 if isinstance(node, str) else node for node in nodes], dtype=np.int64),
+        "node_strs": np.array([node if isinstance(node, str) else "" for node in nodes], dtype=str),
+        "node_is_str": is_str,
+        "u": u,
+        "v": v,
+        "capacity": np.array([-1 if c is None else c for c in capacity], dtype=np.int64),
+        "fidelity": np.array([np.nan if f is None else f for f in fidelity], dtype=np.float64),
+    }
+
+def source_stamp(path):
+    """
+    Identifica a versão do arquivo de origem pelo tamanho e pela data de modificação.
+    """
+    stat = os.stat(path)
+    return np.array([CACHE_FORMAT, stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+def load_topology(path, use_cache=True):
+    """
+    Lê a topologia de um arquivo. Na primeira leitura o resultado é gravado em `<path>.npz`; nas seguintes, se o arquivo de
+    origem não mudou, o cache é lido no lugar do arquivo.
+
+    Args:
+        path (str): Caminho do arquivo.
+        use_cache (bool, optional): Lê e grava o cache `.npz`. Defaults to True.
+
+    Returns:
+        topology (dict): Arrays de `FIELDS` (os rótulos dos nós são recuperados por `node_labels`).
+    """
+    cache = f"{path}.npz"
+    stamp = source_stamp(path)
+
+    if use_cache and os.path.exists(cache):
+        with np.load(cache) as data:
+            if np.array_equal(data["stamp"], stamp):
+                return {key: data[key] for key in FIELDS}
+
+    topology = parse_topology(path)
+
+    if use_cache:
+        try:
+            # Escrita atômica: outro processo nunca lê um cache incompleto
+            temporary = f"{cache}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as file:
+                np.savez(file, stamp=stamp, **topology)
+            os.replace(temporary, cache)
+        except OSError:
+            # Diretório somente leitura: segue sem cache
+            pass
+
+    return topology
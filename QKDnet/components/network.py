@@ -1,15 +1,33 @@
 import networkx as nx
 import matplotlib.pyplot as plt
+import os
 import random
+import numpy as np
+from ..quantum import QubitBatch, EPRBatch
+from ..utils import sparse_flip_indices
+from .channels import ChannelTable
+from .route import Route
+from .graph import NetworkxBackend, CSRBackend
+from . import generators, loader
 
 class Network():
     """
     Um objeto para utilizar como rede.
     """
+    # Abaixo desta probabilidade de inversão, a interferência é sorteada por saltos geométricos (custo proporcional ao número de erros)
+    SPARSE_NOISE_THRESHOLD = 0.05
+    
     def __init__(self) -> None:
         self.G = None
+        # Estrutura usada pelos buscadores de rotas (networkx ou csr)
+        self.backend = "networkx"
+        self.graph = None
+        # Nós que podem ser Alice ou Bob
+        self.endpoints = None
         self.channels = None
+        self.routes = {}
         self.topology = None
+        self.topology_version = 0
         self.controller = None
         self.fidelity = 1
         self.nqubits = 100
@@ -55,14 +73,46 @@ class Network():
         """
         self.controller = controller
     
-    def set_fidelity(self, fidelity):
+    def set_fidelity(self, fidelity, mask=None):
         """
-        Define a fidelidade dos canais.
+        Define a fidelidade dos canais, alterando apenas a fidelidade (a carga, a capacidade e os EPRs são mantidos).
+
+        Args:
+            fidelity (float or array): Nova fidelidade.
+            mask (array, optional): Máscara booleana ou ids dos canais alterados. Defaults to None (todos os canais, e passa a ser o padrão da rede).
         """
-        self.fidelity = fidelity
+        if mask is None:
+            self.fidelity = fidelity
+        
         # Atualiza a fidelidade dos canais
-        self.assign_to_net(self.G)
+        if self.channels is not None:
+            # Invalida os valores derivados da fidelidade (as rotas continuam válidas)
+            self.channels.set_fidelity(fidelity, mask)
+        
+    def set_backend(self, backend):
+        """
+        Define a estrutura de grafo usada pelos buscadores de rotas.
+
+        Args:
+            backend (str): Tipo de backend (networkx, csr). O csr é indicado para topologias com milhares de nós.
+        """
+        if backend not in ("networkx", "csr"):
+            raise ValueError(f"Backend inválido: {backend}. Use 'networkx' ou 'csr'.")
         
+        self.backend = backend
+        if self.G is not None:
+            self.graph = self.build_graph(self.G)
+            # As rotas calculadas com o backend anterior são descartadas
+            self.topology_version += 1
+    
+    def build_graph(self, G):
+        """
+        Monta a estrutura de grafo do backend escolhido.
+        """
+        if self.backend == "csr":
+            return CSRBackend(G)
+        return NetworkxBackend(G)
+    
     def set_nqubits(self, nqubits):
         """
         Define o número de qubits.
@@ -75,13 +125,72 @@ class Network():
         """
         self.neprs = neprs
     
-    def set_capacity(self, capacity):
+    def set_capacity(self, capacity, mask=None):
         """
-        Define a capacidade dos canais.
+        Define a capacidade dos canais, alterando apenas a capacidade (a carga, a fidelidade e os EPRs são mantidos).
+
+        Args:
+            capacity (int or array): Nova capacidade.
+            mask (array, optional): Máscara booleana ou ids dos canais alterados. Defaults to None (todos os canais, e passa a ser o padrão da rede).
         """
-        self.capacity = capacity
+        if mask is None:
+            self.capacity = capacity
+        
         # Atualiza a capacidade dos canais
-        self.assign_to_net(self.G)
+        if self.channels is not None:
+            self.channels.capacity[slice(None) if mask is None else mask] = capacity
+    
+    def snapshot(self):
+        """
+        Guarda o estado mutável da rede: a carga e os EPRs dos canais e os qubits disponíveis dos nós.
+        O grafo, os canais e as tabelas de rotas não são copiados.
+
+        Returns:
+            snapshot (dict): Estado da rede, para ser passado a `restore()`.
+        """
+        return {
+            "channels": self.channels,
+            "load": self.channels.load.copy(),
+            "epr_available": self.channels.epr_available.copy(),
+            "qubits_available": dict(self.G.nodes(data="qubits_available")),
+        }
+    
+    def restore(self, snapshot):
+        """
+        Volta a rede ao estado guardado por `snapshot()`, sem reconstruir a topologia.
+
+        Args:
+            snapshot (dict): Estado retornado por `snapshot()`.
+        """
+        if snapshot["channels"] is not self.channels:
+            raise ValueError("O snapshot pertence a outra topologia da rede.")
+        
+        self.channels.load[:] = snapshot["load"]
+        self.channels.epr_available[:] = snapshot["epr_available"]
+        for node, qubits in snapshot["qubits_available"].items():
+            self.G.nodes[node]["qubits_available"] = qubits
+    
+    def get_route(self, nodes):
+        """
+        Retorna a `Route` (internada) correspondente a uma lista de nós. Os ids dos canais são calculados apenas na primeira vez.
+
+        Args:
+            nodes (list): Lista com os nós que compõem a rota: [1, 2, 3, 4...]
+
+        Returns:
+            route (Route): Rota da rede.
+        """
+        if isinstance(nodes, Route) and nodes.channels is self.channels:
+            return nodes
+        
+        key = tuple(nodes)
+        route = self.routes.get(key)
+        
+        if route is None:
+            route = Route(key, self.channels)
+            self.routes[key] = route
+        
+        return route
     
     def remove_load(self, rota):
         """
@@ -94,13 +203,8 @@ class Network():
         if len(rota) < 2:
             return
         
-        # Iterar sobre os pares de nós consecutivos na rota
-        for link in zip(rota[:-1], rota[1:]):
-            # Obtém os nós que formam o link
-            node_from, node_to = link
-            
-            # Atualiza a carga do canal correspondente
-            self.channels[(node_from, node_to)]["load"] -= 1
+        # Atualiza, de uma vez, a carga dos canais da rota
+        self.get_route(rota).add_load(-1)
         
     def add_load(self, rota):
         """
@@ -113,15 +217,18 @@ class Network():
         if len(rota) < 2:
             return
         
-        # Iterar sobre os pares de nós consecutivos na rota
-        for link in zip(rota[:-1], rota[1:]):
-            # Obtém os nós que formam o link
-            node_from, node_to = link
-            
-            # Atualiza a carga do canal correspondente
-            self.channels[(node_from, node_to)]["load"] += 1
-
+        # Atualiza, de uma vez, a carga dos canais da rota
+        self.get_route(rota).add_load(1)
     
+    def has_capacity(self, rota):
+        """
+        Verifica se todos os canais da rota têm capacidade maior que a carga atual.
+
+        Args:
+            rota (list): Lista com os nós que compõem a rota: [1, 2, 3, 4...]
+        """
+        return self.get_route(rota).has_capacity()
+
     def assign_to_net(self, G):
         """
         Atribui as propriedades dos nós e canais à rede.
@@ -129,32 +236,86 @@ class Network():
         for node in G.nodes:
             G.nodes[node]["qubits_available"] = random.randint(4, 10)
         
+        # Cada aresta gera dois canais, um em cada sentido
+        links = list(G.edges)
+        links += [(v, u) for u, v in G.edges]
+        
         # Initialize channels
-        channels = {(u, v): {
-            # Carga do canal
-            "load": 0,
-            # Capacidade do canal
-            "capacity": self.capacity,
-            # EPRs
-            "epr_available": random.randint(1, 2),
-            # fidelity 
-            "fidelity_value": self.fidelity,
-        } for u, v in G.edges}
-
-        channels.update({(v, u): {
-            # Carga do canal
-            "load": 0,
-            # Capacidade do canal
-            "capacity": self.capacity,
-            # EPRs
-            "epr_available": random.randint(1, 2),
-            # Fidelity 
-            "fidelity_value": self.fidelity,
-        } for u, v in G.edges})  # Add reverse direction channels
+        channels = ChannelTable(
+            links,
+            capacity=self.capacity,
+            epr_available=np.random.randint(1, 3, len(links)),
+            fidelity=self.fidelity,
+        )
+        
+        self.G = G
+        self.graph = self.build_graph(G)
+        self.endpoints = self.eligible_endpoints(G)
+        self.channels = channels
+        self.routes = {}
+        # Invalida as tabelas de rotas que dependem do grafo e dos canais anteriores
+        self.topology_version += 1
+
+    def assign_edges(self, nodes, u, v, fidelity=None, capacity=None, positions=None):
+        """
+        Atribui as propriedades dos nós e canais à rede a partir de arrays de arestas, sem passar pelo dicionário de canais.
+        Usado pelas topologias sintéticas de grande escala e pelas topologias lidas de arquivos.
+
+        Args:
+            nodes (sequence): Rótulos dos nós.
+            u, v (array): Extremidades das arestas (índices em `nodes`).
+            fidelity (array, optional): Fidelidade de cada aresta. Defaults to None (usa `self.fidelity`).
+            capacity (array, optional): Capacidade de cada aresta. Defaults to None (usa `self.capacity`).
+            positions (array, optional): Coordenadas dos nós, guardadas no atributo "pos". Defaults to None.
+        """
+        qubits = np.random.randint(4, 11, len(nodes)).tolist()
+        if positions is None:
+            attributes = ({"qubits_available": q} for q in qubits)
+        else:
+            attributes = ({"qubits_available": q, "pos": pos} for q, pos in zip(qubits, positions.tolist()))
+        
+        # Traduz os índices nos rótulos, se os nós não forem 0..n-1
+        if not isinstance(nodes, range):
+            labels = np.empty(len(nodes), dtype=object)
+            labels[:] = list(nodes)
+            u, v = labels[u], labels[v]
+        
+        G = nx.Graph()
+        G.add_nodes_from(zip(nodes, attributes))
+        G.add_edges_from(zip(u.tolist(), v.tolist()))
+        
+        # Os dois sentidos de uma aresta têm as mesmas propriedades
+        channels = ChannelTable.from_edges(
+            u, v,
+            capacity=self.capacity if capacity is None else np.concatenate((capacity, capacity)),
+            epr_available=np.random.randint(1, 3, 2 * len(u)),
+            fidelity=self.fidelity if fidelity is None else np.concatenate((fidelity, fidelity)),
+        )
         
         self.G = G
+        self.graph = self.build_graph(G)
+        self.endpoints = self.eligible_endpoints(G)
         self.channels = channels
+        self.routes = {}
+        self.topology_version += 1
+    
+    def load_topology(self, path, use_cache=True):
+        """
+        Cria a rede a partir de um arquivo de lista de arestas ("u v [capacidade] [fidelidade]" por linha) ou GraphML
+        (atributos "capacity" e "fidelity" nas arestas). Valores ausentes usam `self.capacity` e `self.fidelity`.
+        A leitura é guardada em `<path>.npz`, então as próximas cargas do mesmo arquivo não precisam interpretá-lo.
 
+        Args:
+            path (str): Caminho do arquivo.
+            use_cache (bool, optional): Lê e grava o cache `.npz`. Defaults to True.
+        """
+        topology = loader.load_topology(path, use_cache)
+        self.topology = os.path.basename(path)
+        
+        capacity = np.where(topology["capacity"] < 0, self.capacity, topology["capacity"])
+        fidelity = np.where(np.isnan(topology["fidelity"]), self.fidelity, topology["fidelity"])
+        self.assign_edges(loader.node_labels(topology), topology["u"], topology["v"], fidelity, capacity)
+    
     def set_topology(self, topology, *args):
         if topology == "Fully Connected":
             self.set_fully_connected_topology(*args)
@@ -166,6 +327,12 @@ class Network():
             self.set_star_topology(*args)
         elif topology == "Line":
             self.set_line_topology_network(*args)
+        elif topology == "Waxman":
+            self.set_waxman_topology(*args)
+        elif topology == "Barabasi-Albert":
+            self.set_barabasi_albert_topology(*args)
+        elif topology == "Random Geometric":
+            self.set_random_geometric_topology(*args)
         elif topology == "USA":
             self.set_USA_topology()
         elif topology == "China":
@@ -245,7 +412,7 @@ class Network():
         G = nx.convert_node_labels_to_integers(G)
         
         # Assign properties to the nodes and channels
-        self.G, self.channels = self.assign_to_net(G)
+        self.assign_to_net(G)
         
         
     def set_line_topology_network(self, num_nodes):
@@ -260,10 +427,68 @@ class Network():
         
         # Create a line topology (path graph)
         G = nx.path_graph(num_nodes)
-        G = nx.convert_node_labels_to_integers(self.G)
+        G = nx.convert_node_labels_to_integers(G)
 
         # Assign random weights and initial memory to nodes
-        self.G, self.channels = self.assign_to_net(G)
+        self.assign_to_net(G)
+    
+    ### Topologias sintéticas ###
+    def set_waxman_topology(self, num_nodes, alpha=0.4, beta=0.1, length_scale=1.0):
+        """
+        Cria uma rede com topologia de Waxman, com os nós espalhados no quadrado unitário.
+        Só a maior componente conexa é mantida, então a rede pode ter menos de `num_nodes` nós.
+        A fidelidade de cada canal decai com o seu comprimento, a partir de `self.fidelity`.
+
+        Args:
+            num_nodes (int): Número de nós.
+            alpha (float, optional): Alcance das arestas. Defaults to 0.4.
+            beta (float, optional): Densidade de arestas. Defaults to 0.1.
+            length_scale (float, optional): Comprimento em que o excesso de fidelidade sobre 0.5 cai a 1/e. Defaults to 1.0.
+        """
+        self.topology = "Waxman"
+        positions = generators.random_positions(num_nodes)
+        u, v = generators.waxman_edges(positions, alpha, beta)
+        self.assign_synthetic(positions, u, v, length_scale)
+    
+    def set_barabasi_albert_topology(self, num_nodes, m=2, length_scale=1.0):
+        """
+        Cria uma rede com topologia de Barabási–Albert (livre de escala). Os nós recebem posições aleatórias no quadrado unitário,
+        usadas apenas para calcular o comprimento e a fidelidade dos canais.
+
+        Args:
+            num_nodes (int): Número de nós.
+            m (int, optional): Número de arestas de cada novo nó. Defaults to 2.
+            length_scale (float, optional): Comprimento em que o excesso de fidelidade sobre 0.5 cai a 1/e. Defaults to 1.0.
+        """
+        self.topology = "Barabasi-Albert"
+        positions = generators.random_positions(num_nodes)
+        u, v = generators.barabasi_albert_edges(num_nodes, m)
+        self.assign_synthetic(positions, u, v, length_scale)
+    
+    def set_random_geometric_topology(self, num_nodes, radius, length_scale=1.0):
+        """
+        Cria uma rede com topologia geométrica aleatória: os nós são espalhados no quadrado unitário e ligados quando estão a uma
+        distância menor ou igual a `radius`. Só a maior componente conexa é mantida, então a rede pode ter menos de `num_nodes` nós.
+
+        Args:
+            num_nodes (int): Número de nós.
+            radius (float): Alcance máximo de um canal.
+            length_scale (float, optional): Comprimento em que o excesso de fidelidade sobre 0.5 cai a 1/e. Defaults to 1.0.
+        """
+        self.topology = "Random Geometric"
+        positions = generators.random_positions(num_nodes)
+        u, v = generators.random_geometric_edges(positions, radius)
+        self.assign_synthetic(positions, u, v, length_scale)
+    
+    def assign_synthetic(self, positions, u, v, length_scale):
+        """
+        Atribui à rede uma topologia sintética, com a fidelidade de cada canal derivada do seu comprimento.
+        Apenas a maior componente conexa é mantida (nós renumerados de 0 em diante), para que todo par de nós tenha rota.
+        """
+        positions, u, v = generators.keep_largest_component(positions, u, v)
+        lengths = generators.edge_lengths(positions, u, v)
+        fidelity = generators.distance_fidelity(lengths, self.fidelity, length_scale)
+        self.assign_edges(range(len(positions)), u, v, fidelity, positions=positions)
     
     ### Topologias especiais ###
     def set_USA_topology(self):
@@ -287,7 +512,7 @@ class Network():
         G.add_edges_from(edges)
         G = nx.convert_node_labels_to_integers(G)
         
-        self.G, self.channels = self.assign_to_net(G)
+        self.assign_to_net(G)
         
     def set_china_topology(self):
         """
@@ -373,6 +598,54 @@ class Network():
         self.assign_to_net(G)
 
         
+    def eligible_endpoints(self, G):
+        """
+        Monta o array dos nós que podem ser Alice ou Bob. Nós com rótulo String agem apenas como switch ou repetidores
+        e ficam de fora, a não ser que todos os nós sejam String (topologias lidas de arquivos, por exemplo).
+
+        Returns:
+            endpoints (array): Rótulos dos nós elegíveis.
+        """
+        nodes = [node for node in G.nodes if not isinstance(node, str)]
+        if not nodes:
+            nodes = list(G.nodes)
+        
+        endpoints = np.empty(len(nodes), dtype=object)
+        endpoints[:] = nodes
+        return endpoints
+    
+    def sample_pairs(self, n, traffic_matrix=None):
+        """
+        Sorteia n pares (alice, bob) de nós elegíveis distintos de uma vez.
+
+        Args:
+            n (int): Número de pares.
+            traffic_matrix (array, optional): Matriz (k x k), na ordem de `self.endpoints`, com o peso de cada par (alice, bob).
+                A diagonal é ignorada. Defaults to None (pares uniformes).
+
+        Returns:
+            alice, bob (array): Nós de Alice e de Bob de cada par.
+        """
+        k = len(self.endpoints)
+        if k < 2:
+            raise ValueError("A rede precisa de pelo menos dois nós elegíveis para formar um par.")
+        
+        if traffic_matrix is None:
+            alice = np.random.randint(0, k, n)
+            # Sorteia entre os k - 1 nós restantes e pula a posição de alice
+            bob = np.random.randint(0, k - 1, n)
+            bob += bob >= alice
+        else:
+            weights = np.array(traffic_matrix, dtype=np.float64)
+            if weights.shape != (k, k):
+                raise ValueError(f"A matriz de tráfego deve ter formato ({k}, {k}), na ordem de network.endpoints.")
+            np.fill_diagonal(weights, 0)
+            if weights.sum() <= 0:
+                raise ValueError("A matriz de tráfego não tem nenhum par com peso positivo.")
+            alice, bob = np.divmod(np.random.choice(k * k, n, p=weights.ravel() / weights.sum()), k)
+        
+        return self.endpoints[alice], self.endpoints[bob]
+    
     def random_alice_bob(self):
         """
         Escolhe um nó aleatório na rede para Alice e outro para Bob. Útil para protocolos com um remetente e um receptor.
@@ -380,84 +653,92 @@ class Network():
         Returns:
             alice, bob (int) : Número correspondente ao nó do grafo.
         """
+        alice, bob = self.sample_pairs(1)
+        return alice[0], bob[0]
+    
+    def route_flip_probability(self, route):
+        """
+        Calcula a probabilidade de um qubit chegar em Bob com o bit invertido após percorrer a rota.
+        O valor é guardado na `Route` e recalculado apenas quando alguma fidelidade muda.
+
+        Args:
+            route (list): Lista com os nós da rota, de Alice até Bob.
+
+        Returns:
+            float: Probabilidade de inversão de ponta a ponta.
+        """
+        return self.get_route(route).flip_probability
+    
+    def route_interference(self, route, size):
+        """
+        Sorteia, de uma vez, quais de `size` qubits chegam em Bob com o bit invertido ao percorrer a rota.
+        Em rotas de alta fidelidade, salta direto entre os qubits invertidos ao invés de sortear cada um.
+
+        Args:
+            route (list): Lista com os nós da rota, de Alice até Bob.
+            size (int): Número de qubits enviados.
+
+        Returns:
+            interference_mask (array): Máscara bool com os qubits que chegam com o bit invertido.
+        Notas:
+            A máscara é a paridade das inversões em todos os enlaces: um qubit invertido em um número par de enlaces
+            chega intacto e fica False. Ela não indica "sofreu interferência em algum enlace".
+        """
+        flip_probability = self.route_flip_probability(route)
         
-        sender = random.choice(list(self.G.nodes))
-        receiver = random.choice(list(self.G.nodes))
-        
-        # Garante que nem sender, nem receiver sejam String (Nós que agem apenas como switch ou repetidores)
-        while isinstance(sender, str):
-            sender = random.choice(list(self.G.nodes))
-        while isinstance(receiver, str):
-            receiver = random.choice(list(self.G.nodes))
-        
-        if receiver >= self.G.number_of_nodes():
-            receiver -= self.G.number_of_nodes()  
-        
-        # Evitar que os nós sejam os mesmos
-        while sender == receiver:
-            receiver = random.choice(list(self.G.nodes))
-        alice, bob = sender, receiver
+        if flip_probability < self.SPARSE_NOISE_THRESHOLD:
+            interference_mask = np.zeros(size, dtype=bool)
+            interference_mask[sparse_flip_indices(size, flip_probability)] = True
+            return interference_mask
         
-        return alice, bob
+        return np.random.random(size) < flip_probability
     
     def send_qubits(self, route, qubits):
         """
-        Envia os qubits em uma lista pela rota escolhida. O qubit sofre interferência de acordo com a fidelidade do canal.
+        Envia os qubits em uma lista pela rota escolhida. O qubit é invertido de acordo com a probabilidade de inversão de ponta a ponta da rota.
 
         Args:
             route (rota): Rota definida para o envio do qubit.
-            qubits (list): Lista com qubits preparados.
+            qubits (list): Lista com qubits preparados ou um `QubitBatch`.
 
         Returns:
-            received_qubits (list): Lista com os qubits que chegaram no Bob.
-        """
-        received_qubits = []
-        index_interference_qubit = set()
-
-        # Cada qubit irá percorrer a rota, de alice até bob
-        for qubit in qubits:
-            # O range vai até o penúltimo elemento da rota, pois o último é o nó de Bob
-            for indice in range(len(route) - 1):
-                # Channels (u, v) -> u é o nó de origem e v é o nó de destino. Aqui, acessamos os nós pelo seu índice na rota.
-                # O canal é acessado pelo índice do nó de origem e destino na rota. O canal guarda um dicionario com as propriedades do canal. "fidelity_value" é a fidelidade do canal.
-                channel_fidelity = self.channels[(route[indice], route[indice+1])]["fidelity_value"]
-                # O qubit sofre interferência com uma probabilidade igual a 1 - fidelidade do canal
-                if random.uniform(0, 1) > channel_fidelity:
-                    qubit.interference()
-                    index_interference_qubit.add(qubits.index(qubit))
-
-            # Adiciona o qubit na lista de qubits recebidos
-            received_qubits.append(qubit)
-
-        return received_qubits, index_interference_qubit
+            received_qubits (list): Lista com os qubits que chegaram no Bob (ou o próprio `QubitBatch`).
+            interference_mask (array): Máscara bool com os qubits que chegam com o bit invertido (paridade das inversões
+                em todos os enlaces; inversões em número par se cancelam). Ver `route_interference`.
+        """
+        interference_mask = self.route_interference(route, len(qubits))
+        
+        if isinstance(qubits, QubitBatch):
+            qubits.interference(interference_mask)
+            return qubits, interference_mask
+        
+        # Apenas os qubits sorteados sofrem interferência
+        for index in np.flatnonzero(interference_mask):
+            qubits[index].interference()
+
+        return list(qubits), interference_mask
     
     def send_eprs(self, route, eprs):
         """
-        Envia os EPRs em uma lista pela rota escolhida. O qubit sofre interferência de acordo com a fidelidade do canal.
+        Envia os EPRs em uma lista pela rota escolhida. O qubit é invertido de acordo com a probabilidade de inversão de ponta a ponta da rota.
 
         Args:
             route (rota): Rota definida para o envio do qubit.
-            eprs (list): Lista com pares emaranhados preparados.
+            eprs (list): Lista com pares emaranhados preparados ou um `EPRBatch`.
 
         Returns:
-            received_qubits (list): Lista com os qubits que chegaram no Bob.
-        """
-        received_qubits = []
-        index_interference_qubit = set()
-        
-        # Cada qubit irá percorrer a rota, de alice até bob
-        for epr in eprs:
-            # O range vai até o penúltimo elemento da rota, pois o último é o nó de Bob
-            for indice in range(len(route) - 1):
-                # Channels (u, v) -> u é o nó de origem e v é o nó de destino. Aqui, acessamos os nós pelo seu índice na rota
-                channel_fidelity = self.channels[(route[indice], route[indice+1])]["fidelity_value"]
-                # O qubit sofre interferência com uma probabilidade igual a 1 - fidelidade do canal
-                if random.uniform(0, 1) > channel_fidelity:
-                    qubit = epr.qubit2.interference()
-                    index_interference_qubit.add(eprs.index(epr))
-                    
-            qubit = epr.qubit2
-            # Adiciona o qubit na lista de qubits recebidos
-            received_qubits.append(qubit)
-                          
-        return received_qubits, index_interference_qubit
\ No newline at end of file
+            received_qubits (list): Lista com os qubits que chegaram no Bob (ou o `QubitBatch` transmitido).
+            interference_mask (array): Máscara bool com os qubits que chegam com o bit invertido (paridade das inversões
+                em todos os enlaces; inversões em número par se cancelam). Ver `route_interference`.
+        """
+        interference_mask = self.route_interference(route, len(eprs))
+        
+        if isinstance(eprs, EPRBatch):
+            eprs.interference(interference_mask)
+            return eprs.qubit2, interference_mask
+        
+        # Apenas a metade transmitida dos pares sorteados sofre interferência
+        for index in np.flatnonzero(interference_mask):
+            eprs[index].qubit2.interference()
+        
+        return [epr.qubit2 for epr in eprs], interference_mask
@@ -0,0 +1,72 @@
+import numpy as np
+
+class Route(tuple):
+    """
+    Uma rota imutável: a tupla de nós de Alice até Bob, com os ids dos canais e o número de saltos pré-calculados.
+    Notas:
+        As rotas são internadas por rede: `Network.get_route(nodes)` devolve sempre o mesmo objeto para os mesmos nós;
+        O produto das fidelidades só é recalculado quando alguma fidelidade da tabela de canais muda;
+        Como o mesmo objeto é compartilhado, os atributos não podem ser alterados nem criados de fora. Subclasses de tuple
+        não aceitam `__slots__` não vazios, então os atributos ficam no `__dict__`, escrito apenas pela própria classe.
+    """
+    def __new__(cls, nodes, channels):
+        route = super().__new__(cls, nodes)
+        # Ids dos canais da rota, na ordem em que são percorridos
+        edge_ids = channels.edge_ids(route)
+        edge_ids.flags.writeable = False
+        route.__dict__.update(
+            channels=channels,
+            edge_ids=edge_ids,
+            hops=len(edge_ids),
+            _fidelity=None,
+            _flip_probability=None,
+            _version=None,
+        )
+        return route
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Route é imutável: o atributo '{name}' não pode ser alterado.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Route é imutável: o atributo '{name}' não pode ser removido.")
+
+    def _update(self):
+        """
+        Recalcula os valores derivados das fidelidades, se alguma fidelidade da tabela mudou.
+        """
+        if self._version != self.channels.version:
+            fidelities = self.channels.fidelity[self.edge_ids]
+            self.__dict__.update(
+                _fidelity=float(np.prod(fidelities)),
+                # Cada canal inverte o bit com probabilidade 1 - fidelidade e as inversões se cancelam duas a duas, então só a paridade importa
+                _flip_probability=float((1 - np.prod(2 * fidelities - 1)) / 2),
+                _version=self.channels.version,
+            )
+
+    @property
+    def fidelity(self):
+        """
+        Produto das fidelidades dos canais da rota.
+        """
+        self._update()
+        return self._fidelity
+
+    @property
+    def flip_probability(self):
+        """
+        Probabilidade de um qubit chegar em Bob com o bit invertido após percorrer a rota.
+        """
+        self._update()
+        return self._flip_probability
+
+    def has_capacity(self):
+        """
+        Verifica se todos os canais da rota têm capacidade maior que a carga atual.
+        """
+        return bool(np.all(self.channels.capacity[self.edge_ids] > self.channels.load[self.edge_ids]))
+
+    def add_load(self, amount=1):
+        """
+        Soma `amount` à carga de todos os canais da rota.
+        """
+        self.channels.load[self.edge_ids] += amount
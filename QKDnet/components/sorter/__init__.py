@@ -1,4 +1,6 @@
 from .fifoSorter import FifoSorter
 from .urgencySorter import UrgencySorter
 from .shortestRouteSorter import ShortestRouteSorter
-from .longestRouteSorter import LongestRouteSorter
\ No newline at end of file
+from .longestRouteSorter import LongestRouteSorter
+from .requestQueue import RequestQueue
+from .calendarQueue import CalendarQueue
\ No newline at end of file
@@ -0,0 +1,42 @@
+class CalendarQueue():
+    """
+    Fila de calendário: as requisições ficam em baldes indexados pelo time slot do seu prazo (`request.deadline`).
+    Notas:
+        A cada time slot, só os baldes vencidos são percorridos, então o custo não depende do tamanho da fila;
+        Requisições encerradas antes do prazo não são retiradas do balde: são ignoradas quando o balde vence.
+    """
+    def __init__(self) -> None:
+        # Time slot -> requisições com prazo nesse slot
+        self.buckets = {}
+        # Primeiro time slot ainda não percorrido
+        self.next_slot = 0
+
+    def push(self, request):
+        """
+        Adiciona uma requisição ao balde do seu prazo.
+        """
+        # Um prazo já vencido entra no próximo balde a ser percorrido
+        slot = max(request.deadline, self.next_slot)
+        self.buckets.setdefault(slot, []).append(request)
+
+    def pop_due(self, time):
+        """
+        Retira as requisições com prazo até `time` que ainda não foram encerradas.
+
+        Args:
+            time (int): Time slot atual.
+
+        Returns:
+            requests (list): Requisições vencidas, na ordem de prazo e de chegada.
+        """
+        due = []
+        while self.next_slot <= time:
+            for request in self.buckets.pop(self.next_slot, ()):
+                if not request.finished:
+                    due.append(request)
+            self.next_slot += 1
+
+        return due
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.buckets.values())
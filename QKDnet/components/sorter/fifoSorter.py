@@ -15,4 +15,8 @@ class FifoSorter(Sorter):
         Returns:
             requests (list): Lista de requisições ordenadas.
         """
-        return requests
\ No newline at end of file
+        return requests
+    
+    def key(self, request):
+        # A ordem de chegada é o desempate da fila
+        return 0
\ No newline at end of file
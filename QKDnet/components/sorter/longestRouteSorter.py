@@ -16,4 +16,8 @@ class LongestRouteSorter(Sorter):
             sorted_requests (list): Lista de requisições ordenadas.
         """
         sorted_requests = sorted(requests, key=lambda request: request.route_length, reverse=True)
-        return sorted_requests
\ No newline at end of file
+        return sorted_requests
+    
+    def key(self, request):
+        # Negativo da rota: equivale ao `reverse=True` estável de `sort`
+        return -request.route_length
\ No newline at end of file
@@ -0,0 +1,128 @@
+import heapq
+from itertools import count
+
+class RequestQueue():
+    """
+    Fila de requisições mantida ordenada de forma incremental pela chave do ordenador (`sorter.key`).
+    Notas:
+        Cada requisição é guardada como (chave, ordem de chegada, requisição). A fila fica sempre na ordem de
+        `sorter.sort` sobre as requisições ativas na ordem de chegada: empates são resolvidos pela chegada;
+        As requisições novas entram em um heap (O(log n)) e só são intercaladas com a fila ordenada na próxima leitura;
+        As remoções são preguiçosas: a requisição é marcada e descartada na próxima intercalação;
+        A chave é calculada na inserção. Se os dados de que ela depende mudam (ex.: chaves que ainda faltam), `update`
+        reinsere só aquela requisição (O(log n)); `refresh` recalcula as chaves de toda a fila (O(n log n)).
+    """
+    def __init__(self, sorter, requests=()) -> None:
+        self.sorter = sorter
+        # Entradas [chave, ordem de chegada, requisição, ativa] já ordenadas
+        self.entries = []
+        # Entradas novas, ainda não intercaladas
+        self.pending = []
+        # Entrada de cada requisição ativa, por id()
+        self.lookup = {}
+        # Número de entradas removidas ainda presentes em `entries`
+        self.dead = 0
+        self.counter = count()
+        self.push(requests)
+
+    def push(self, requests):
+        """
+        Adiciona requisições à fila, na ordem recebida.
+
+        Args:
+            requests (list): Lista de requisições.
+        """
+        for request in requests:
+            entry = [self.sorter.key(request), next(self.counter), request, True]
+            self.lookup[id(request)] = entry
+            heapq.heappush(self.pending, entry)
+
+    def extend(self, requests):
+        self.push(requests)
+
+    def remove(self, request):
+        """
+        Remove uma requisição da fila. A entrada é só marcada, e descartada na próxima intercalação.
+        """
+        entry = self.lookup.pop(id(request), None)
+        if entry is None:
+            raise ValueError("A requisição não está na fila.")
+        entry[3] = False
+        self.dead += 1
+
+    def update(self, request):
+        """
+        Recalcula a chave de uma requisição da fila. Se ela mudou, a entrada antiga é marcada como removida e uma nova,
+        com a mesma ordem de chegada, entra no heap das novas: O(log n), sem reordenar a fila.
+
+        Args:
+            request (Request): Requisição cuja chave pode ter mudado.
+        """
+        entry = self.lookup.get(id(request))
+        if entry is None:
+            raise ValueError("A requisição não está na fila.")
+        
+        key = self.sorter.key(request)
+        if key == entry[0]:
+            return
+        
+        entry[3] = False
+        self.dead += 1
+        entry = [key, entry[1], request, True]
+        self.lookup[id(request)] = entry
+        heapq.heappush(self.pending, entry)
+
+    def set_sorter(self, sorter):
+        """
+        Troca o ordenador e reordena as requisições da fila (empates pela ordem de chegada).
+        """
+        self.sorter = sorter
+        self.refresh()
+    
+    def refresh(self):
+        """
+        Recalcula a chave de todas as requisições da fila e, se alguma mudou, reordena a fila. Usado quando todas as
+        chaves podem ter mudado (outro ordenador, outra rede); para poucas requisições, `update` evita percorrer a fila.
+        """
+        self.merge()
+        changed = False
+        for entry in self.entries:
+            key = self.sorter.key(entry[2])
+            if key != entry[0]:
+                entry[0] = key
+                changed = True
+        
+        # As entradas (e o `lookup`) são as mesmas; só a ordem muda
+        if changed:
+            self.entries.sort()
+
+    def merge(self):
+        """
+        Intercala as entradas novas com a fila ordenada e descarta as entradas removidas.
+        """
+        if not self.pending and not self.dead:
+            return
+
+        pending = [heapq.heappop(self.pending) for _ in range(len(self.pending))]
+        self.entries = [entry for entry in heapq.merge(self.entries, pending) if entry[3]]
+        self.dead = 0
+
+    def __iter__(self):
+        self.merge()
+        # Remoções feitas durante a iteração também são puladas
+        return (entry[2] for entry in self.entries if entry[3])
+
+    def __len__(self):
+        return len(self.lookup)
+
+    def __bool__(self):
+        return bool(self.lookup)
+
+    def __contains__(self, request):
+        return id(request) in self.lookup
+
+    def copy(self):
+        """
+        Retorna uma lista com as requisições, na ordem da fila.
+        """
+        return list(self)
@@ -16,4 +16,7 @@ class ShortestRouteSorter(Sorter):
             sorted_requests (list): Lista de requisições ordenadas.
         """
         sorted_requests = sorted(requests, key=lambda request: request.route_length)
-        return sorted_requests
\ No newline at end of file
+        return sorted_requests
+    
+    def key(self, request):
+        return request.route_length
\ No newline at end of file
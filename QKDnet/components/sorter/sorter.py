@@ -6,4 +6,11 @@ class Sorter(ABC):
 
     @abstractmethod
     def sort(self):
+        pass
+
+    @abstractmethod
+    def key(self, request):
+        """
+        Chave de ordenação de uma requisição, usada pela `RequestQueue`. Ordenar pela chave (crescente, estável) deve dar a mesma ordem de `sort`.
+        """
         pass
\ No newline at end of file
@@ -36,4 +36,7 @@ class UrgencySorter(Sorter):
         # Ordena as requisições
         sorted_requests = sorted(requests, key=custom_sort)
         
-        return sorted_requests
\ No newline at end of file
+        return sorted_requests
+    
+    def key(self, request):
+        return custom_sort(request)
\ No newline at end of file
@@ -1,3 +1,5 @@
 from .b92 import B92
 from .bb84 import BB84
-from .e91 import E91
\ No newline at end of file
+from .e91 import E91
+from .protocol import ProtocolResult
+from .registry import get_protocol
\ No newline at end of file
@@ -1,5 +1,6 @@
+import numpy as np
 from .protocol import Protocol
-from ..quantum import Qubit
+from ..quantum import Qubit, QubitBatch
 
 class B92(Protocol):
     def __init__(self):
@@ -7,6 +8,20 @@ class B92(Protocol):
         self.app = "B92"
         self.sucess_rate = 0.20
     
+    def key_yield(self, flip_probability):
+        """
+        Probabilidade de um qubit enviado entrar na chave compartilhada.
+        Só há resultado conclusivo e correto quando a base de Bob difere do bit de Alice (1/2) e a medição dá 1 (1/2).
+        Nesse caso o qubit está em superposição, então a interferência do canal não altera o resultado.
+
+        Args:
+            flip_probability (float): Probabilidade de o qubit chegar em Bob com o bit invertido.
+
+        Returns:
+            float: Probabilidade por qubit.
+        """
+        return 0.25
+    
     def prepare_qubits(self, key):
         """
         Prepara os qubits de acordo com a chave clássica gerada.
@@ -15,8 +30,12 @@ class B92(Protocol):
             key (lista): Lista de 0s e 1s com a chave.
         
         Returns:
-            results (list): Lista com resultados das medições dos qubits.
+            results (list): Lista com resultados das medições dos qubits. No modo "array", um `QubitBatch`.
         """
+        if self.mode == "array":
+            qubits = QubitBatch(len(key))
+            qubits.H(key)
+            return qubits
     
         qubits = []
         
@@ -38,6 +57,12 @@ class B92(Protocol):
         Returns:
             results (list): Lista com resultados das medições dos qubits.
         """
+        if self.mode == "array":
+            bases = np.asarray(bases, dtype=np.uint8)
+            qubits.H(bases)
+            measure = qubits.measure()
+            # Lógica do B92: medindo 1, o bit é o oposto da base; medindo 0, o resultado é inconclusivo
+            return np.where(measure == 1, 1 - bases, np.uint8(self.NO_BIT))
         
         results = []
         result = 0
@@ -62,14 +87,20 @@ class B92(Protocol):
             
         return results
         
-    def run(self, network, route):
+    def run(self, network, route, store_keys=False):
         """
         Executa o protocolo QKD B92.
 
         Args:
             route (list): Lista com os nós da rota, de Alice até Bob.
-            
+            store_keys (bool, optional): Guarda as chaves no resultado. Defaults to False.
+
+        Returns:
+            result (ProtocolResult): Resultado da execução.
         """
+        if self.mode == "statistical":
+            return self.run_statistical(network, route)
+        
         # Número de qubits para geração da chave
         nqubits = network.nqubits
         
@@ -92,7 +123,4 @@ class B92(Protocol):
         shared_key = super().check_key(key_bob, key_alice)
         
         # Resultados da execução
-        self.generated_key = key_alice
-        self.shared_key = shared_key
-        self.different_bits = len(key_alice) - len(shared_key)
-        self.key_sucess = len(shared_key) / nqubits
\ No newline at end of file
+        return self.result(nqubits, key_alice, shared_key, store_keys)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from .protocol import Protocol
-from ..quantum import Qubit
+from ..quantum import Qubit, QubitBatch
 
 class BB84(Protocol):
     """
@@ -11,6 +11,19 @@ class BB84(Protocol):
         self.sucess_rate = 0.4
 
     
+    def key_yield(self, flip_probability):
+        """
+        Probabilidade de um qubit enviado entrar na chave compartilhada.
+        As bases coincidem com probabilidade 1/2 e, nesse caso, o bit só é mantido se a rota não o inverteu.
+
+        Args:
+            flip_probability (float): Probabilidade de o qubit chegar em Bob com o bit invertido.
+
+        Returns:
+            float: Probabilidade por qubit.
+        """
+        return 0.5 * (1 - flip_probability)
+    
     def prepare_qubits(self, key, bases):
         """
         Prepara os qubits de acordo com a chave clássica gerada.
@@ -20,8 +33,13 @@ class BB84(Protocol):
             bases (lista): Lista de 0s e 1s com as bases.
         
         Returns:
-            results (list): Lista com resultados das medições dos qubits.
+            results (list): Lista com resultados das medições dos qubits. No modo "array", um `QubitBatch`.
         """
+        if self.mode == "array":
+            qubits = QubitBatch(len(key))
+            qubits.X(key)
+            qubits.H(bases)
+            return qubits
         
         qubits = []
         
@@ -43,6 +61,9 @@ class BB84(Protocol):
             qubits (list): Lista de Qubits.
             bases (list): Lista com 0s e 1s.
         """
+        if self.mode == "array":
+            qubits.H(bases)
+            return qubits.measure()
 
         measurement = 0
         results = []
@@ -54,16 +75,20 @@ class BB84(Protocol):
         
         return results
     
-    def run(self, network, route):
+    def run(self, network, route, store_keys=False):
         """
         Executa o protocolo QKD BB84.
 
         Args:
             network (Network): Rede em que o protocolo será executado.
+            store_keys (bool, optional): Guarda as chaves no resultado. Defaults to False.
 
         Returns:
-            Dict : Dicionário de dicionários com as informações das execuções.
+            result (ProtocolResult): Resultado da execução.
         """
+        if self.mode == "statistical":
+            return self.run_statistical(network, route)
+        
         # Número de qubits para geração da chave
         nqubits = network.nqubits
         
@@ -94,7 +119,4 @@ class BB84(Protocol):
         shared_key = super().check_key(key_bob, key_alice)
 
         # Resultados da execução
-        self.generated_key = key_alice
-        self.shared_key = shared_key
-        self.different_bits = len(key_alice) - len(shared_key)
-        self.key_sucess = len(shared_key) / nqubits
\ No newline at end of file
+        return self.result(nqubits, key_alice, shared_key, store_keys)
\ No newline at end of file
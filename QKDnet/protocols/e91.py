@@ -1,4 +1,4 @@
-from ..quantum import EPR
+from ..quantum import EPR, EPRBatch
 from .protocol import Protocol
 
 class E91(Protocol):
@@ -10,6 +10,19 @@ class E91(Protocol):
         self.app = "E91"
         self.sucess_rate = 0.4
         
+    def key_yield(self, flip_probability):
+        """
+        Probabilidade de um par enviado entrar na chave compartilhada.
+        As bases coincidem com probabilidade 1/2 e, nesse caso, o bit só é mantido se a rota não inverteu a metade de Bob.
+
+        Args:
+            flip_probability (float): Probabilidade de o qubit chegar em Bob com o bit invertido.
+
+        Returns:
+            float: Probabilidade por par.
+        """
+        return 0.5 * (1 - flip_probability)
+    
     def prepare_qubits(self, key, bases):
         """
         Prepara os qubits de acordo com a chave clássica gerada.
@@ -19,8 +32,13 @@ class E91(Protocol):
             bases (lista): Lista de 0s e 1s com as bases.
             
         Returns:
-            results (list): Lista com resultados das medições dos qubits.
+            results (list): Lista com resultados das medições dos qubits. No modo "array", um `EPRBatch`.
         """
+        if self.mode == "array":
+            pairs = EPRBatch(len(key))
+            pairs.X(key)
+            pairs.H(bases)
+            return pairs
         
         pairs = []
         
@@ -42,6 +60,9 @@ class E91(Protocol):
             qubits (list): Lista de Qubits.
             bases (list): Lista com 0s e 1s.
         """
+        if self.mode == "array":
+            qubits.H(bases)
+            return qubits.measure()
         
         measurement = 0
         results = []
@@ -55,14 +76,21 @@ class E91(Protocol):
         return results
     
     
-    def run(self, network, route):
+    def run(self, network, route, store_keys=False):
         """
         Executa o protocolo QKD E91.
 
         Args:
             network (Network): Rede em que o protocolo será executado.
             route (lista): Rota de Alice para Bob.
+            store_keys (bool, optional): Guarda as chaves no resultado. Defaults to False.
+
+        Returns:
+            result (ProtocolResult): Resultado da execução.
         """
+        if self.mode == "statistical":
+            return self.run_statistical(network, route)
+        
         # Número de qubits para geração da chave
         nqubits = network.nqubits
         
@@ -88,14 +116,8 @@ class E91(Protocol):
         # Chave obtida de acordo com as bases
         key_bob = super().get_key(measured_qubits, matching_bases)
         
-        # Chave obtida de acordo com as bases
-        key_bob = super().get_key(measured_qubits, matching_bases)
-        
         # Checando chave
         shared_key = super().check_key(key_bob, key_alice)
         
         # Resultados da execução
-        self.generated_key = key_alice
-        self.shared_key = shared_key
-        self.different_bits = len(key_alice) - len(shared_key)
-        self.key_sucess = len(shared_key) / nqubits
\ No newline at end of file
+        return self.result(nqubits, key_alice, shared_key, store_keys)
\ No newline at end of file
@@ -4,17 +4,92 @@
 # Agora o protocolo acessa o tamanho das cahves pela rede. Talvez trocar isso...
 
 import random 
+import numpy as np
 from abc import ABC, abstractmethod
+from ..utils import pack_key, unpack_key
+
+class ProtocolResult:
+    """
+    Resultado de uma execução de um protocolo QKD.
+    Notas:
+        As chaves só são guardadas quando pedido (`run(..., store_keys=True)`); caso contrário, ficam None;
+        As chaves são guardadas compactadas (8 bits por byte, `pack_key`); `generated_bits()` e `shared_bits()` recuperam os bits.
+    """
+    __slots__ = ("shared_length", "different_bits", "key_sucess", "generated_key", "shared_key")
+    
+    def __init__(self, shared_length, different_bits, key_sucess, generated_key=None, shared_key=None) -> None:
+        self.shared_length = shared_length
+        self.different_bits = different_bits
+        self.key_sucess = key_sucess
+        self.generated_key = generated_key
+        self.shared_key = shared_key
+    
+    def generated_bits(self):
+        """
+        Retorna os bits da chave gerada por Alice, ou None se ela não foi guardada.
+        """
+        if self.generated_key is None:
+            return None
+        return unpack_key(self.generated_key, self.shared_length + self.different_bits)
+    
+    def shared_bits(self):
+        """
+        Retorna os bits da chave compartilhada, ou None se ela não foi guardada.
+        """
+        if self.shared_key is None:
+            return None
+        return unpack_key(self.shared_key, self.shared_length)
+    
+    def __repr__(self) -> str:
+        return f"ProtocolResult(shared_length={self.shared_length}, different_bits={self.different_bits}, key_sucess={self.key_sucess})"
+
 class Protocol(ABC):
     """
     Protocolo QKD.
+    Notas:
+        O protocolo não guarda estado entre execuções: `run` devolve um `ProtocolResult`;
+        Por isso, as requisições compartilham uma instância por (app, modo), obtida com `get_protocol`;
+        As instâncias compartilhadas são congeladas (`frozen`): o modo delas não pode mais ser alterado.
     """
+    # Modos de execução disponíveis
+    MODES = ("list", "array", "statistical")
+    # No modo vetorizado, marca os bits descartados (equivalente ao None do modo lista)
+    NO_BIT = 255
+    
     def __init__(self) -> None:
         self.app = None
-        self.generated_key = None
-        self.shared_key = None
-        self.different_bits = None
-        self.key_sucess = None
+        # Instâncias compartilhadas por `get_protocol` não podem mudar de modo
+        self.frozen = False
+        self._mode = "array"
+    
+    @property
+    def mode(self):
+        return self._mode
+    
+    @mode.setter
+    def mode(self, mode):
+        self.set_mode(mode)
+    
+    def set_mode(self, mode):
+        """
+        Define o modo de execução do protocolo.
+        
+        Args:
+            mode (str): Modo de execução. "list" usa listas bit a bit e "array" usa arrays NumPy (uint8/bool) gerados e filtrados em bloco.
+                "statistical" não simula os qubits: sorteia apenas o tamanho da chave compartilhada (`shared_key` fica None).
+        
+        Raises:
+            ValueError: Se o modo é inválido ou se a instância é compartilhada (`frozen`).
+        """
+        if self.frozen:
+            raise ValueError("O protocolo é compartilhado e não pode mudar de modo; use get_protocol(app, mode).")
+        
+        mode = mode.lower()
+        
+        if mode not in self.MODES:
+            raise ValueError("Invalid mode parameter")
+        
+        self._mode = mode
     
     def create_key(self, size):
         """
@@ -24,8 +99,10 @@ class Protocol(ABC):
             size (int): Tamanho desejado para a chave.
 
         Returns:
-            key (list): Uma lista com 0s e 1s aleatórios.
+            key (list): Uma lista com 0s e 1s aleatórios. No modo "array", um array uint8.
         """
+        if self.mode == "array":
+            return np.random.randint(0, 2, size, dtype=np.uint8)
         
         key = []
         
@@ -41,6 +118,8 @@ class Protocol(ABC):
         Args:
             size (int): Tamanho da chave.
         """
+        if self.mode == "array":
+            return np.random.randint(0, 2, size, dtype=np.uint8)
         
         bases = []
         
@@ -57,8 +136,11 @@ class Protocol(ABC):
             base_bob (list): Lista de 0s e 1s para as bases escolhidas por Bob.
 
         Returns:
-            matching_bases (lista): Lista de Trues e Falses para representar o macth das bases.
+            matching_bases (lista): Lista de Trues e Falses para representar o macth das bases. No modo "array", uma máscara bool.
         """
+        if self.mode == "array":
+            return np.asarray(base_alice) == np.asarray(base_bob)
+        
         matching_bases = []
         
         for a, b in zip(base_alice, base_bob):
@@ -78,8 +160,11 @@ class Protocol(ABC):
             match_bases (lista): Lista com as bases que deram match.
         
         Returns:
-            bob_key (list): Chave obtida por Bob.
+            bob_key (list): Chave obtida por Bob. No modo "array", os bits descartados valem `NO_BIT`.
         """
+        if self.mode == "array":
+            measured_qubits = np.asarray(measured_qubits, dtype=np.uint8)
+            return np.where(match_bases, measured_qubits, np.uint8(self.NO_BIT))
         
         bob_key = []
         
@@ -99,6 +184,11 @@ class Protocol(ABC):
             key_alice (list): Chave gerada por Alice.
             key_bob (list): Chave obtida por Bob.
         """
+        if self.mode == "array":
+            key_bob = np.asarray(key_bob, dtype=np.uint8)
+            # Bits descartados (NO_BIT) nunca coincidem com os bits de Alice
+            return key_bob[key_bob == np.asarray(key_alice, dtype=np.uint8)]
+        
         shared_key = []
         
         for bob_bit, alice_bit in zip(key_bob, key_alice):
@@ -108,6 +198,51 @@ class Protocol(ABC):
         
         return shared_key
 
+    def result(self, nqubits, key_alice, shared_key, store_keys):
+        """
+        Monta o registro com o resultado de uma execução.
+
+        Args:
+            nqubits (int): Número de qubits enviados.
+            key_alice (list): Chave gerada por Alice.
+            shared_key (list): Chave compartilhada.
+            store_keys (bool): Guarda as chaves, compactadas, no registro.
+        """
+        shared_length = len(shared_key)
+        if not store_keys:
+            return ProtocolResult(shared_length, nqubits - shared_length, shared_length / nqubits)
+        
+        return ProtocolResult(shared_length, nqubits - shared_length, shared_length / nqubits, pack_key(key_alice), pack_key(shared_key))
+
+    def run_statistical(self, network, route):
+        """
+        Executa o protocolo no modo estatístico. O tamanho da chave compartilhada é sorteado de uma binomial,
+        em O(1), ao invés de simular cada qubit em cada enlace da rota.
+        Notas:
+            O resultado depende de `network.route_flip_probability(route)`, a probabilidade de inversão de ponta a ponta
+            usada também pelos modos simulados; se o modelo de ruído da rede mudar, `key_yield` e essa probabilidade precisam acompanhar;
+            A equivalência com os modos "list" e "array" é verificada em `tests/test_statistical_mode.py`.
+
+        Args:
+            network (Network): Rede em que o protocolo será executado.
+            route (list): Lista com os nós da rota, de Alice até Bob.
+
+        Returns:
+            result (ProtocolResult): Resultado da execução, sem as chaves (`shared_key` não é simulada).
+        """
+        # Número de qubits para geração da chave
+        nqubits = network.nqubits
+        
+        # Cada qubit entra na chave compartilhada de forma independente, com a mesma probabilidade
+        probability = self.key_yield(network.route_flip_probability(route))
+        shared_key_length = int(np.random.binomial(nqubits, probability))
+        
+        return ProtocolResult(shared_key_length, nqubits - shared_key_length, shared_key_length / nqubits)
+
+    @abstractmethod
+    def key_yield(self, flip_probability):
+        pass
+
     @abstractmethod
     def prepare_qubits(self):
         pass
@@ -120,4 +255,4 @@ class Protocol(ABC):
     def run(self):
         pass
     
-    # Implementar as ações realizadas pelos protocolos
\ No newline at end of file
+    # Implementar as ações realizadas pelos protocolos
@@ -0,0 +1,42 @@
+from .protocol import Protocol
+from .bb84 import BB84
+from .e91 import E91
+from .b92 import B92
+
+# Classe de cada app
+APPS = {"BB84": BB84, "E91": E91, "B92": B92}
+
+# Instâncias compartilhadas, por (app, modo)
+_instances = {}
+
+def get_protocol(app, mode="array"):
+    """
+    Retorna a instância compartilhada do protocolo de uma app. Os protocolos não guardam estado entre execuções,
+    então todas as requisições com a mesma app e o mesmo modo usam o mesmo objeto.
+    Notas:
+        A instância retornada é congelada: `set_mode` levanta ValueError. Para outro modo, peça outra instância a esta função.
+
+    Args:
+        app (str): Nome da app (BB84, E91 ou B92).
+        mode (str, optional): Modo de execução ("list", "array" ou "statistical", sem diferenciar maiúsculas). Defaults to "array".
+
+    Returns:
+        protocol (Protocol): Protocolo da app.
+    """
+    # Normaliza o modo antes de montar a chave, para que "Array" e "array" compartilhem a mesma instância
+    mode = mode.lower()
+    if mode not in Protocol.MODES:
+        raise ValueError("Invalid mode parameter")
+    
+    key = (app, mode)
+    protocol = _instances.get(key)
+    
+    if protocol is None:
+        if app not in APPS:
+            raise ValueError("Invalid app parameter")
+        protocol = APPS[app]()
+        protocol.set_mode(mode)
+        protocol.frozen = True
+        _instances[key] = protocol
+    
+    return protocol
@@ -1,2 +1,2 @@
-from .qubit import Qubit
-from .epr import EPR
\ No newline at end of file
+from .qubit import Qubit, QubitBatch
+from .epr import EPR, EPRBatch
\ No newline at end of file
@@ -1,4 +1,4 @@
-from .qubit import Qubit
+from .qubit import Qubit, QubitBatch
 
 class EPR():
     """
@@ -19,3 +19,36 @@ class EPR():
     def getQubits(self):
         return self.qubit1, self.qubit2
 
+
+class EPRBatch():
+    """
+    Um lote de N pares em estado de Bell. Cada metade dos pares é um `QubitBatch`.
+    Notas:
+        `qubit1` fica com Alice e `qubit2` é a metade transmitida até Bob.
+    """
+    def __init__(self, size) -> None:
+        self.qubit1 = QubitBatch(size)
+        self.qubit2 = QubitBatch(size)
+    
+    def __len__(self):
+        return len(self.qubit2)
+
+    def H(self, mask=None):
+        self.qubit1.H(mask)
+        self.qubit2.H(mask)
+    
+    def X(self, mask=None):
+        self.qubit1.X(mask)
+        self.qubit2.X(mask)
+    
+    def interference(self, mask=None):
+        """
+        Aplica a interferência do canal na metade transmitida dos pares.
+        
+        Args:
+            mask (array, optional): Máscara com os pares que sofrem interferência. Defaults to None (todos).
+        """
+        self.qubit2.interference(mask)
+        
+    def getQubits(self):
+        return self.qubit1, self.qubit2
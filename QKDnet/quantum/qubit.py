@@ -1,4 +1,5 @@
 from random import randint
+import numpy as np
 
 class Qubit():
     """
@@ -63,3 +64,68 @@ class Qubit():
             self.lastResult = self.lastState
         return collapse
 
+
+class QubitBatch():
+    """
+    Um lote de qubits armazenado como arrays paralelos (struct-of-arrays).
+    Notas:
+        A posição i de cada array corresponde a um qubit, o que equivale a uma lista de `Qubit`;
+        Ao iniciar o lote, todos os qubits estão no estado |0>;
+        Em `lastResult`, o valor `NO_RESULT` equivale ao None de um `Qubit` ainda não medido.
+    """
+    NO_RESULT = 255
+    
+    def __init__(self, size) -> None:
+        self.lastState = np.zeros(size, dtype=np.uint8)
+        self.lastResult = np.full(size, self.NO_RESULT, dtype=np.uint8)
+        self.superposition = np.zeros(size, dtype=bool)
+    
+    def __len__(self):
+        return len(self.lastState)
+    
+    def X(self, mask=None):
+        """
+        Faz um bitflip nos qubits do lote.
+        
+        Args:
+            mask (array, optional): Máscara (ou array de 0s e 1s) com os qubits que sofrem a porta. Defaults to None (todos).
+        """
+        if mask is None:
+            self.lastState ^= 1
+        else:
+            self.lastState ^= np.asarray(mask, dtype=np.uint8)
+    
+    def H(self, mask=None):
+        """
+        Coloca ou retira os qubits do lote da superposição.
+        
+        Args:
+            mask (array, optional): Máscara (ou array de 0s e 1s) com os qubits que sofrem a porta. Defaults to None (todos).
+        """
+        if mask is None:
+            self.superposition ^= True
+        else:
+            self.superposition ^= np.asarray(mask, dtype=bool)
+    
+    def interference(self, mask=None):
+        """
+        Simula uma pequena interferência nos qubits do lote. Faz um bit flip com um XOR.
+        
+        Args:
+            mask (array, optional): Máscara com os qubits que sofrem interferência. Defaults to None (todos).
+        """
+        self.X(mask)
+    
+    def measure(self):
+        """
+        Mede o estado de todos os qubits do lote.
+        returns:
+            collapse (array): Array uint8 com os resultados das medições (0 ou 1).
+        """
+        collapse = self.lastState.copy()
+        
+        # Qubits em superposição colapsam em um valor aleatório 0 ou 1; os demais, no último valor registrado
+        collapse[self.superposition] = np.random.randint(0, 2, np.count_nonzero(self.superposition), dtype=np.uint8)
+        self.superposition[:] = False
+        self.lastResult[:] = collapse
+        return collapse
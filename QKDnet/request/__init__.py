@@ -1 +1,3 @@
-from .request import Request
\ No newline at end of file
+from .request import Request
+from .requestBatch import RequestBatch
+from .requestRegistry import RequestRegistry
\ No newline at end of file
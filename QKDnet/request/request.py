@@ -1,12 +1,14 @@
 # App pode ser o próprio protocolo, ao invés de só uma string
 from ..protocols import *
+from ..utils import unpack_key
+import numpy as np
 
 class Request:
     """
     Um objeto para ser usado como requisição de chave quântica.
     """
     
-    def __init__(self, num_id, category, app, priority, max_time, alice, bob):
+    def __init__(self, num_id, category, app, priority, max_time, alice, bob, protocol_mode="array"):
         # Identificação
         self.num_id = num_id
         self.category = category
@@ -15,7 +17,7 @@ class Request:
         self.set_keys_need()
         self.app = app
         self.protocol = None
-        self.set_protocol(app)
+        self.set_protocol(app, protocol_mode)
         self.priority = priority
         # Rota
         self.alice = alice
@@ -24,10 +26,14 @@ class Request:
         self.route_length = None
         # Tempo
         self.max_time = max_time
-        self.time_left = None
         self.esttimeted_time = None
         self.max_start_time = None
+        # Prazo (time slot) e relógio usado para calcular o tempo restante
+        self.deadline = None
+        self.clock = None
         self.set_time_left()
+        # Trechos de chave entregues (compactados), guardados só se o controlador guardar as chaves
+        self.key_material = []
         # Status
         self.served = False
         self.finished = False
@@ -35,19 +41,15 @@ class Request:
     def __str__(self) -> str:
         return f"{self.app}: {self.alice}-{self.bob} (P:{self.priority} Key: {self.keys_need})"
     
-    def set_protocol(self, app):
+    def set_protocol(self, app, mode="array"):
         """
-        Define o protocolo em uso de acordo com a app.
+        Define o protocolo em uso de acordo com a app. A instância do protocolo é compartilhada entre as requisições.
 
         Args:
             app (string): Nome da app (BB84, E91 ou B92)
+            mode (str, optional): Modo de execução do protocolo. Defaults to "array".
         """
-        if app == "BB84":
-            self.protocol = BB84()
-        elif app == "E91":
-            self.protocol = E91()
-        elif app == "B92":
-            self.protocol = B92()
+        self.protocol = get_protocol(app, mode)
     
     def set_keys_need(self):
         """
@@ -82,10 +84,28 @@ class Request:
     
     def set_time_left(self):
         """
-        Define o tempo máximo (em time slot) para o request ser atendido.
+        Define o tempo máximo (em time slot) para o request ser atendido, contado a partir do instante 0.
         """
-        # Define o tempo restante para ser atendido
-        self.time_left = self.max_time
+        self.deadline = self.max_time
+        self.clock = None
+    
+    def set_deadline(self, clock):
+        """
+        Define o prazo da requisição a partir do tempo atual de um relógio (um objeto com o atributo `time`, como o controlador).
+
+        Args:
+            clock (Controller): Relógio.
+        """
+        self.clock = clock
+        self.deadline = clock.time + self.max_time
+    
+    @property
+    def time_left(self):
+        """
+        Tempo (em time slot) restante para o request ser atendido, derivado do prazo e do relógio.
+        """
+        now = self.clock.time if self.clock is not None else 0
+        return max(self.deadline - now, 0)
     
     def get_info(self):
         """
@@ -107,8 +127,18 @@ class Request:
         """
         self.keys_need -= keys
         
-    def update_time(self):
+    def add_key_material(self, packed, length):
+        """
+        Guarda um trecho de chave entregue à requisição.
+
+        Args:
+            packed (array): Bits do trecho, compactados (`pack_key`).
+            length (int): Número de bits do trecho.
+        """
+        self.key_material.append((packed, length))
+    
+    def get_key_material(self):
         """
-        Atualiza o tempo de atendimento para a requisição.
+        Retorna todos os bits de chave entregues à requisição, na ordem em que foram obtidos.
         """
-        self.time_left = self.time_left - 1 if self.time_left > 0 else 0
\ No newline at end of file
+        return np.concatenate([unpack_key(packed, length) for packed, length in self.key_material] or [np.empty(0, dtype=np.uint8)])
@@ -0,0 +1,48 @@
+import numpy as np
+from .request import Request
+
+class RequestBatch:
+    """
+    Lote de requisições guardado como arrays paralelos (um campo por array), sem criar um objeto por requisição.
+    Notas:
+        A categoria e a app de cada requisição são guardadas como índices em `categories` e `apps`;
+        Os objetos `Request` só são criados quando pedidos, por `__getitem__` ou `to_requests()`.
+    """
+    def __init__(self, categories, apps, category, app, priority, max_time, alice, bob, first_id=0, protocol_mode="array") -> None:
+        self.categories = categories
+        self.apps = apps
+        self.protocol_mode = protocol_mode
+        self.num_id = np.arange(first_id, first_id + len(category))
+        self.category = category
+        self.app = app
+        self.priority = priority
+        self.max_time = max_time
+        self.alice = alice
+        self.bob = bob
+    
+    def __len__(self):
+        return len(self.num_id)
+    
+    def __getitem__(self, i):
+        return Request(
+            int(self.num_id[i]),
+            self.categories[self.category[i]],
+            self.apps[self.app[i]],
+            int(self.priority[i]),
+            int(self.max_time[i]),
+            self.alice[i],
+            self.bob[i],
+            self.protocol_mode,
+        )
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+    
+    def to_requests(self):
+        """
+        Cria os objetos `Request` de todas as requisições do lote.
+
+        Returns:
+            requests (list): Lista com requisições.
+        """
+        return list(self)
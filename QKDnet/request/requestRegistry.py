@@ -0,0 +1,53 @@
+class RequestRegistry:
+    """
+    Registro das requisições recebidas pelo controlador, indexadas por `num_id`.
+    Notas:
+        Só as requisições ativas ficam no registro; ao serem encerradas (atendidas ou expiradas), saem dele e são contadas em `finished`;
+        Verificar se todas as requisições terminaram e encerrar uma requisição custam O(1).
+    """
+    def __init__(self) -> None:
+        # num_id -> requisição ativa
+        self.active = {}
+        # Número de requisições encerradas
+        self.finished = 0
+    
+    def add(self, requests):
+        """
+        Registra requisições ativas.
+
+        Args:
+            requests (list): Lista de requisições.
+        """
+        for request in requests:
+            if request.num_id in self.active:
+                raise ValueError(f"Já existe uma requisição ativa com o id {request.num_id}.")
+            self.active[request.num_id] = request
+    
+    def finish(self, request):
+        """
+        Encerra uma requisição ativa.
+
+        Args:
+            request (Request): Requisição atendida ou expirada.
+        """
+        del self.active[request.num_id]
+        request.finished = True
+        self.finished += 1
+    
+    def all_finished(self):
+        """
+        Verifica se não há mais requisições ativas.
+        """
+        return not self.active
+    
+    def get(self, num_id):
+        """
+        Retorna a requisição ativa com o id dado, ou None.
+        """
+        return self.active.get(num_id)
+    
+    def __len__(self):
+        return len(self.active)
+    
+    def __contains__(self, request):
+        return self.active.get(request.num_id) is request
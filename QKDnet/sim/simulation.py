@@ -1,7 +1,22 @@
-import random
-from ..request import Request
+import numpy as np
+from ..request import RequestBatch
+from ..utils import AliasTable
 
 class Simulation:
+    CATEGORIES = ["Category A", "Category B", "Category C", "Category D", "Category E"]
+    # Distribuição das categorias em cada caso de simulação
+    CATEGORY_DISTRIBUTIONS = {
+        1: [0.3, 0.3, 0.2, 0.15, 0.05],
+        2: [0.25, 0.25, 0.2, 0.15, 0.15],
+        3: [0.2] * 5,
+        4: [0.15, 0.15, 0.2, 0.25, 0.25],
+        5: [1, 0, 0, 0, 0],
+        6: [0, 1, 0, 0, 0],
+        7: [0, 0, 1, 0, 0],
+        8: [0, 0, 0, 1, 0],
+        9: [0, 0, 0, 0, 1],
+    }
+    
     def __init__(self, network, controller) -> None:
         # Propriedades
         self.network = network
@@ -14,6 +29,8 @@ class Simulation:
         self.apps = ["BB84", "E91", "B92"]
         self.apps_distribution = [0.33, 0.33, 0.33]
         self.max_time_request = None
+        self.protocol_mode = "array"
+        self.traffic_matrix = None
         # Resultados
         self.throughputs = []
         self.throughput = 0
@@ -78,6 +95,24 @@ class Simulation:
     
         self.max_time_request = time
     
+    def set_protocol_mode(self, mode):
+        """
+        Define o modo de execução dos protocolos das requisições geradas.
+
+        Args:
+            mode (str): Modo de execução ("list", "array" ou "statistical").
+        """
+        self.protocol_mode = mode
+    
+    def set_traffic_matrix(self, traffic_matrix):
+        """
+        Define a matriz de tráfego usada para sortear Alice e Bob das requisições geradas.
+
+        Args:
+            traffic_matrix (array): Matriz (k x k), na ordem de `network.endpoints`, com o peso de cada par. None volta aos pares uniformes.
+        """
+        self.traffic_matrix = traffic_matrix
+    
     def get_key_success_rate(self):
         """
         Retorna a taxa de sucesso da chave.
@@ -104,52 +139,43 @@ class Simulation:
         self.key_sucess_rate = 0
         self.throughput = 0
         
-    def generate_requests(self):
+    def generate_request_batch(self, n=None):
         """
-        Gera uma lista de requisições aleatórias de QKD.
+        Gera um lote de requisições aleatórias de QKD, sorteando todos os campos de uma vez como arrays.
+        A categoria e a app são sorteadas por tabelas de alias da distribuição do caso e de `apps_distribution`.
 
         Args:
-            num_requests (int): Número de requisições.
-            diff_nodes (int): Número entre os nós. Defauts to 5.
-            apps (list): Lista de apps disponíveis.
+            n (int, optional): Número de requisições. Defaults to None (usa `n_requests`).
             
         Returns:
-            requests (list): Lista com requisições.
+            batch (RequestBatch): Lote de requisições.
         """
-        categories = ["Category A", "Category B", "Category C", "Category D", "Category E"]
-        requests = []
-        
-        if self.case == 1:
-            category_distribution = [0.3, 0.3, 0.2, 0.15, 0.05]
-        elif self.case == 2:
-            category_distribution = [0.25, 0.25, 0.2, 0.15, 0.15]
-        elif self.case == 3:
-            category_distribution = [0.2] * 5
-        elif self.case == 4:
-            category_distribution = [0.15, 0.15, 0.2, 0.25, 0.25]       
-        elif self.case == 5:
-            category_distribution = [1, 0, 0, 0, 0]
-        elif self.case == 6:
-            category_distribution = [0, 1, 0, 0, 0]
-        elif self.case == 7:
-            category_distribution = [0, 0, 1, 0, 0]
-        elif self.case == 8:
-            category_distribution = [0, 0, 0, 1, 0]
-        elif self.case == 9:
-            category_distribution = [0, 0, 0, 0, 1]
-        else:
+        if self.case not in self.CATEGORY_DISTRIBUTIONS:
             raise ValueError("Invalid case parameter")
         
-        # Gera as requisições
-        for i in range(self.n_requests):
-            classe = random.choices(categories, category_distribution)[0]
-            app = random.choices(self.apps, self.apps_distribution)[0]
-            priority = random.randint(1, 5)
-            alice, bob = self.network.random_alice_bob()
-            r = Request(i, classe, app, priority, random.randint(5, 15), alice, bob)
-            requests.append(r)
+        n = self.n_requests if n is None else n
+        alice, bob = self.network.sample_pairs(n, self.traffic_matrix)
+        
+        return RequestBatch(
+            self.CATEGORIES,
+            self.apps,
+            category=AliasTable(self.CATEGORY_DISTRIBUTIONS[self.case]).sample(n),
+            app=AliasTable(self.apps_distribution).sample(n),
+            priority=np.random.randint(1, 6, n),
+            max_time=np.random.randint(5, 16, n),
+            alice=alice,
+            bob=bob,
+            protocol_mode=self.protocol_mode,
+        )
+    
+    def generate_requests(self):
+        """
+        Gera uma lista de requisições aleatórias de QKD.
             
-        return requests
+        Returns:
+            requests (list): Lista com requisições.
+        """
+        return self.generate_request_batch().to_requests()
     
     def run(self, random_requests=True):
         """
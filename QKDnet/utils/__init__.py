@@ -1,2 +1,4 @@
 from .logger import Logger
-from .spreadsheet import *
\ No newline at end of file
+from .spreadsheet import *
+from .sampling import *
+from .keys import *
\ No newline at end of file
@@ -0,0 +1,112 @@
+import os
+import numpy as np
+
+def pack_key(bits):
+    """
+    Compacta uma chave (lista ou array de 0s e 1s) em bytes, 8 bits por byte.
+
+    Args:
+        bits (list): Bits da chave.
+
+    Returns:
+        packed (array): Array uint8 com os bits compactados.
+    """
+    return np.packbits(np.asarray(bits, dtype=np.uint8))
+
+def unpack_key(packed, length):
+    """
+    Recupera os bits de uma chave compactada por `pack_key`.
+
+    Args:
+        packed (array): Bits compactados.
+        length (int): Número de bits da chave.
+
+    Returns:
+        bits (array): Array uint8 com os bits.
+    """
+    return np.unpackbits(np.asarray(packed, dtype=np.uint8), count=length)
+
+
+class KeyExporter():
+    """
+    Grava, à medida que são obtidas, as chaves entregues às requisições em um arquivo mapeado em memória.
+    Notas:
+        O arquivo `path` guarda os bytes compactados de cada trecho de chave, um após o outro;
+        O índice (id da requisição, posição em bytes, número de bits de cada trecho) é gravado em `path + ".idx.npy"` ao fechar;
+        O arquivo cresce dobrando de tamanho, e é cortado no tamanho final ao fechar.
+    """
+    def __init__(self, path, initial_size=1 << 20) -> None:
+        self.path = path
+        self.size = 0
+        self.index = []
+        with open(path, "wb") as file:
+            file.truncate(max(initial_size, 1))
+        self.buffer = np.memmap(path, dtype=np.uint8, mode="r+")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, num_id, packed, length):
+        """
+        Acrescenta um trecho de chave ao arquivo.
+
+        Args:
+            num_id (int): Id da requisição.
+            packed (array): Bits compactados do trecho.
+            length (int): Número de bits do trecho.
+        """
+        end = self.size + len(packed)
+        if end > len(self.buffer):
+            self.grow(end)
+
+        self.buffer[self.size:end] = packed
+        self.index.append((num_id, self.size, length))
+        self.size = end
+
+    def grow(self, needed):
+        """
+        Aumenta o arquivo (ao menos o dobro) e o mapeia novamente.
+        """
+        capacity = max(needed, 2 * len(self.buffer))
+        self.buffer.flush()
+        del self.buffer
+        with open(self.path, "r+b") as file:
+            file.truncate(capacity)
+        self.buffer = np.memmap(self.path, dtype=np.uint8, mode="r+")
+
+    def close(self):
+        """
+        Grava o índice e corta o arquivo no tamanho usado.
+        """
+        if self.buffer is None:
+            return
+
+        self.buffer.flush()
+        self.buffer = None
+        with open(self.path, "r+b") as file:
+            file.truncate(self.size)
+        np.save(f"{self.path}.idx.npy", np.array(self.index, dtype=np.int64).reshape(-1, 3))
+
+    @staticmethod
+    def load(path):
+        """
+        Lê as chaves gravadas por um `KeyExporter`.
+
+        Args:
+            path (str): Caminho do arquivo de chaves.
+
+        Returns:
+            keys (dict): Dicionário {id da requisição: array uint8 com os bits entregues, na ordem em que foram obtidos}.
+        """
+        index = np.load(f"{path}.idx.npy")
+        data = np.memmap(path, dtype=np.uint8, mode="r") if os.path.getsize(path) > 0 else np.empty(0, dtype=np.uint8)
+
+        chunks = {}
+        for num_id, offset, length in index.tolist():
+            packed = data[offset:offset + (length + 7) // 8]
+            chunks.setdefault(num_id, []).append(unpack_key(packed, length))
+
+        return {num_id: np.concatenate(parts) for num_id, parts in chunks.items()}
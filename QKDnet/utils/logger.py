@@ -23,6 +23,13 @@ class Logger(object):
     def activate(self):
         Logger.DISABLED = False
     
+    def enabled(self):
+        """
+        Indica se as mensagens são registradas. Mensagens caras de montar (listas de requisições, cargas das rotas)
+        devem ser montadas só quando este método retorna True.
+        """
+        return not Logger.DISABLED
+    
     def warn(self, message):
         if not Logger.DISABLED:
             self.logger.warning(message)
@@ -0,0 +1,69 @@
+import numpy as np
+
+def sparse_flip_indices(size, probability):
+    """
+    Sorteia quais de `size` eventos independentes, cada um com a mesma probabilidade, acontecem.
+    Ao invés de sortear cada posição, salta direto para a próxima ocorrência com intervalos geométricos,
+    então o custo acompanha o número de ocorrências e não `size`.
+
+    Args:
+        size (int): Número de eventos (qubits).
+        probability (float): Probabilidade de cada evento.
+
+    Returns:
+        indices (array): Posições, em ordem crescente, dos eventos que aconteceram.
+    """
+    if size <= 0 or probability <= 0:
+        return np.empty(0, dtype=np.int64)
+    if probability >= 1:
+        return np.arange(size)
+    
+    # Bloco de saltos suficiente para cobrir `size` na grande maioria dos sorteios
+    expected = size * probability
+    chunk = int(expected + 4 * np.sqrt(expected)) + 16
+    
+    # O salto geométrico conta as tentativas até a próxima ocorrência (>= 1)
+    positions = np.cumsum(np.random.geometric(probability, chunk)) - 1
+    while positions[-1] < size:
+        positions = np.concatenate((positions, positions[-1] + np.cumsum(np.random.geometric(probability, chunk))))
+    
+    return positions[:np.searchsorted(positions, size)]
+
+
+class AliasTable():
+    """
+    Tabela de alias (método de Vose) para sortear índices de uma distribuição discreta em O(1) por amostra.
+    Montar a tabela custa O(k), onde k é o número de categorias.
+    """
+    def __init__(self, weights) -> None:
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim != 1 or len(weights) == 0 or (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError("Os pesos devem ser uma lista não vazia de valores não negativos com soma positiva.")
+        
+        k = len(weights)
+        scaled = weights * k / weights.sum()
+        self.probability = np.ones(k)
+        self.alias = np.arange(k)
+        
+        small = [i for i in range(k) if scaled[i] < 1]
+        large = [i for i in range(k) if scaled[i] >= 1]
+        # Completa cada coluna com menos de 1 usando o excesso de uma coluna com mais de 1
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.probability[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+    
+    def __len__(self):
+        return len(self.probability)
+    
+    def sample(self, size):
+        """
+        Sorteia `size` índices da distribuição.
+
+        Returns:
+            indices (array): Índices sorteados.
+        """
+        column = np.random.randint(0, len(self.probability), size)
+        return np.where(np.random.random(size) < self.probability[column], column, self.alias[column])
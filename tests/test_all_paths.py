@@ -0,0 +1,41 @@
+import random
+import networkx as nx
+import pytest
+from QKDnet import Network
+from QKDnet.components.finder import AllPaths
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+@pytest.mark.parametrize("max_paths, max_hops", [(10, None), (None, 7), (3, 9), (1, None)])
+def test_all_paths_are_the_shortest_simple_paths(backend, max_paths, max_hops):
+    random.seed(3)
+    network = Network()
+    network.set_backend(backend)
+    network.set_topology("Lattice", 4, 4)
+    finder = AllPaths(network)
+    finder.max_paths = max_paths
+    finder.max_hops = max_hops
+
+    for _ in range(10):
+        alice, bob = random.sample(list(network.G.nodes), 2)
+        hops = max_hops if max_hops is not None else nx.shortest_path_length(network.G, alice, bob) + finder.extra_hops
+        expected = sorted(len(path) for path in nx.all_simple_paths(network.G, alice, bob, cutoff=hops))[:max_paths]
+
+        routes = finder.get_paths(alice, bob)
+
+        assert [len(route) for route in routes] == expected
+        assert len(set(routes)) == len(routes)
+        assert all(len(set(route)) == len(route) and network.G.has_edge(u, v) for route in routes for u, v in zip(route[:-1], route[1:]))
+
+def test_unbounded_all_paths_returns_every_simple_path():
+    network = Network()
+    network.set_topology("Lattice", 3, 3)
+    finder = AllPaths(network)
+    finder.max_paths = None
+    finder.extra_hops = None
+
+    routes = finder.get_paths(0, 8)
+    expected = list(nx.all_simple_paths(network.G, 0, 8))
+
+    assert len(routes) == len(expected) > 10
+    assert set(routes) == {tuple(path) for path in expected}
+    assert [len(route) for route in routes] == sorted(len(path) for path in expected)
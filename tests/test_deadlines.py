@@ -0,0 +1,43 @@
+import random
+import numpy as np
+import pytest
+from QKDnet import Network, Controller, Simulation
+from QKDnet.components.allocator import SimpleAllocator
+
+class ScanningAllocator(SimpleAllocator):
+    """
+    Expira as requisições como antes da `CalendarQueue`: percorrendo toda a fila em busca de `time_left == 0`.
+    """
+    def allocate(self):
+        for r in self.controller.requests.copy():
+            if r.time_left == 0:
+                self.controller.data_base.collect_failed_requests_data(r)
+                self.controller.finish_request(r)
+        super().allocate()
+
+def simulate(sorter, seed, scanning):
+    random.seed(seed)
+    np.random.seed(seed)
+    network = Network()
+    network.set_topology("Lattice", 4, 4)
+    network.set_capacity(2)
+    controller = Controller(network)
+    controller.set_sorter(sorter)
+    if scanning:
+        controller.allocator = ScanningAllocator(controller)
+    simulation = Simulation(network, controller)
+    simulation.set_case(4)
+    simulation.set_n_requests(80)
+    simulation.run()
+
+    served = sorted(r.num_id for r in controller.data_base.served_requests)
+    failed = sorted(r.num_id for r in controller.data_base.failed_requests)
+    return served, failed, controller.time
+
+@pytest.mark.parametrize("sorter", ["urgency", "fifo", "longest"])
+@pytest.mark.parametrize("seed", range(3))
+def test_calendar_expiry_matches_scanning_expiry(sorter, seed):
+    served, failed, time = simulate(sorter, seed, scanning=False)
+
+    assert (served, failed, time) == simulate(sorter, seed, scanning=True)
+    assert len(served) + len(failed) == 80
@@ -0,0 +1,49 @@
+import random
+import networkx as nx
+import numpy as np
+import pytest
+from QKDnet import Network, Controller, Simulation
+from QKDnet.components import generators
+
+def test_largest_component_matches_networkx():
+    np.random.seed(0)
+    positions = generators.random_positions(200)
+    u, v = generators.random_geometric_edges(positions, 0.08)
+    G = nx.Graph()
+    G.add_nodes_from(range(200))
+    G.add_edges_from(zip(u.tolist(), v.tolist()))
+    assert nx.number_connected_components(G) > 1
+
+    kept, ku, kv = generators.keep_largest_component(positions, u, v)
+    largest = max(nx.connected_components(G), key=len)
+    H = nx.Graph()
+    H.add_nodes_from(range(len(kept)))
+    H.add_edges_from(zip(ku.tolist(), kv.tolist()))
+
+    assert len(kept) == len(largest)
+    assert nx.is_connected(H)
+    assert H.number_of_edges() == G.subgraph(largest).number_of_edges()
+
+@pytest.mark.parametrize("topology, args", [("Random Geometric", (200, 0.08)), ("Waxman", (200, 0.1, 0.02))])
+def test_simulation_runs_on_sparse_synthetic_topologies(topology, args):
+    random.seed(1)
+    np.random.seed(1)
+    network = Network()
+    network.set_topology(topology, *args)
+    assert nx.is_connected(network.G)
+
+    controller = Controller(network)
+    controller.set_path_finder("shortest")
+    simulation = Simulation(network, controller)
+    simulation.set_case(4)
+    simulation.set_n_requests(30)
+    simulation.run()
+
+    data = controller.data_base
+    assert len(data.served_requests) + len(data.failed_requests) == 30
+
+def test_barabasi_albert_matches_networkx_edge_count():
+    random.seed(0)
+    u, v = generators.barabasi_albert_edges(100, 3)
+    assert len(u) == nx.barabasi_albert_graph(100, 3, seed=0).number_of_edges()
+    assert np.all(u < v)
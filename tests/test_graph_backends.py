@@ -0,0 +1,71 @@
+import random
+from itertools import islice
+import numpy as np
+import pytest
+from QKDnet import Network
+from QKDnet.components.graph import NetworkxBackend, CSRBackend
+from QKDnet.components.finder import ShortestPath, ShortestPaths, KShortestPaths
+
+BACKENDS = ("networkx", "csr")
+
+def build_network(backend):
+    network = Network()
+    network.set_backend(backend)
+    network.set_topology("Lattice", 5, 5)
+    return network
+
+@pytest.fixture
+def pairs():
+    random.seed(11)
+    nodes = list(build_network("networkx").G.nodes)
+    return [tuple(random.sample(nodes, 2)) for _ in range(30)]
+
+def found_paths(finder_class, pairs):
+    """
+    Rotas de cada par em cada backend, consultadas por par (`get_paths`) e em lote (`get_paths_many`).
+    """
+    results = []
+    for backend in BACKENDS:
+        finder = finder_class(build_network(backend))
+        results.append([[list(route) for route in finder.get_paths(alice, bob)] for alice, bob in pairs])
+        finder.clear_cache()
+        batch = finder.get_paths_many(pairs)
+        results.append([[list(route) for route in batch[pair]] for pair in pairs])
+    return results
+
+def assert_simple(paths):
+    assert all(len(set(path)) == len(path) for routes in paths for path in routes)
+
+def test_shortest_path_lengths_match_across_backends(pairs):
+    results = found_paths(ShortestPath, pairs)
+    lengths = [[len(routes[0]) for routes in paths] for paths in results]
+    assert all(other == lengths[0] for other in lengths)
+
+def test_shortest_paths_match_across_backends(pairs):
+    results = found_paths(ShortestPaths, pairs)
+    routes = [[sorted(paths) for paths in result] for result in results]
+    assert all(other == routes[0] for other in routes)
+
+def test_k_shortest_path_lengths_match_across_backends(pairs):
+    results = found_paths(KShortestPaths, pairs)
+    lengths = [[[len(path) for path in paths] for paths in result] for result in results]
+    assert all(other == lengths[0] for other in lengths)
+    for result in results:
+        assert_simple(result)
+
+def test_csr_yen_matches_networkx_on_a_scale_free_graph():
+    random.seed(4)
+    np.random.seed(4)
+    network = Network()
+    network.set_topology("Barabasi-Albert", 300, 2)
+    reference = NetworkxBackend(network.G)
+    csr = CSRBackend(network.G)
+
+    for _ in range(20):
+        alice, bob = random.sample(list(network.G.nodes), 2)
+        paths = list(islice(csr.shortest_simple_paths(alice, bob), 10))
+        expected = list(islice(reference.shortest_simple_paths(alice, bob), 10))
+
+        assert [len(path) for path in paths] == [len(path) for path in expected]
+        assert len({tuple(path) for path in paths}) == len(paths)
+        assert all(network.G.has_edge(u, v) for path in paths for u, v in zip(path[:-1], path[1:]))
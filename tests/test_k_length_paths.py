@@ -0,0 +1,37 @@
+import random
+import networkx as nx
+import pytest
+from QKDnet import Network
+from QKDnet.components.finder import KLengthPaths
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+@pytest.mark.parametrize("length", [None, 4, 6])
+def test_k_length_paths_match_brute_force(backend, length):
+    random.seed(2)
+    network = Network()
+    network.set_backend(backend)
+    network.set_topology("Lattice", 4, 4)
+    finder = KLengthPaths(network)
+    finder.length = length
+    finder.max_paths = None
+
+    for _ in range(10):
+        alice, bob = random.sample(list(network.G.nodes), 2)
+        hops = length if length is not None else nx.shortest_path_length(network.G, alice, bob)
+        expected = {tuple(path) for path in nx.all_simple_paths(network.G, alice, bob, cutoff=hops) if len(path) == hops + 1}
+
+        routes = finder.get_paths(alice, bob)
+        assert len(routes) == len(expected)
+        assert set(routes) == expected
+
+def test_k_length_paths_are_capped():
+    network = Network()
+    network.set_topology("Lattice", 5, 5)
+    finder = KLengthPaths(network)
+    finder.max_paths = 3
+
+    routes = finder.get_paths(0, 24)
+    assert len(routes) == 3
+    assert all(len(route) == 9 for route in routes)
+    # Comprimento impossível (paridade da grade): nenhuma rota
+    assert finder.get_paths(0, 24, 9) == ()
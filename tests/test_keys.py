@@ -0,0 +1,63 @@
+import random
+import numpy as np
+import pytest
+from QKDnet import Network, Controller, Simulation
+from QKDnet.utils import pack_key, unpack_key, KeyExporter
+
+@pytest.mark.parametrize("length", [0, 1, 7, 8, 9, 100])
+def test_pack_key_round_trip(length):
+    bits = np.random.randint(0, 2, length).tolist()
+    packed = pack_key(bits)
+
+    assert packed.dtype == np.uint8 and len(packed) == (length + 7) // 8
+    assert unpack_key(packed, length).tolist() == bits
+
+def test_exporter_round_trip(tmp_path):
+    np.random.seed(3)
+    path = str(tmp_path / "keys.bin")
+    chunks = {}
+    # Arquivo inicial pequeno, para forçar o crescimento
+    with KeyExporter(path, initial_size=4) as exporter:
+        for num_id in [0, 1, 0, 2, 1, 0]:
+            bits = np.random.randint(0, 2, np.random.randint(1, 40)).astype(np.uint8)
+            exporter.append(num_id, pack_key(bits), len(bits))
+            chunks.setdefault(num_id, []).append(bits)
+        assert len(exporter.buffer) > 4
+
+    keys = KeyExporter.load(path)
+    assert set(keys) == set(chunks)
+    assert all(np.array_equal(keys[num_id], np.concatenate(parts)) for num_id, parts in chunks.items())
+    # O arquivo é cortado no tamanho usado
+    assert (tmp_path / "keys.bin").stat().st_size == sum(len(pack_key(b)) for parts in chunks.values() for b in parts)
+
+def test_empty_exporter(tmp_path):
+    path = str(tmp_path / "keys.bin")
+    KeyExporter(path).close()
+    assert KeyExporter.load(path) == {}
+
+def test_controller_stores_and_exports_the_delivered_keys(tmp_path):
+    random.seed(1)
+    np.random.seed(1)
+    network = Network()
+    network.set_topology("Lattice", 3, 3)
+    network.set_capacity(2)
+    controller = Controller(network)
+    controller.set_store_keys(True)
+    path = str(tmp_path / "keys.bin")
+    controller.set_key_exporter(KeyExporter(path))
+    simulation = Simulation(network, controller)
+    simulation.set_case(3)
+    simulation.set_n_requests(10)
+    requests = simulation.generate_requests()
+    keys_need = {request.num_id: request.keys_need for request in requests}
+
+    simulation.requests = requests
+    simulation.run(random_requests=False)
+    controller.key_exporter.close()
+    exported = KeyExporter.load(path)
+
+    assert exported
+    for request in requests:
+        material = request.get_key_material()
+        assert len(material) == keys_need[request.num_id] - request.keys_need
+        assert np.array_equal(exported.get(request.num_id, np.empty(0, dtype=np.uint8)), material)
@@ -0,0 +1,37 @@
+import pytest
+from QKDnet import Network
+from QKDnet.components import loader
+
+def write_edges(tmp_path, text):
+    path = tmp_path / "topology.txt"
+    path.write_text(text)
+    return str(path)
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_mixed_labels_keep_their_types(tmp_path, use_cache):
+    path = write_edges(tmp_path, "1 TR-1 5 0.9\nTR-1 2\n2 3\n")
+
+    # A segunda carga lê o cache `.npz`, quando habilitado
+    for _ in range(2):
+        network = Network()
+        network.load_topology(path, use_cache=use_cache)
+
+        assert list(network.G.nodes) == [1, "TR-1", 2, 3]
+        # O repetidor não pode ser Alice nem Bob
+        assert sorted(network.endpoints.tolist()) == [1, 2, 3]
+
+def test_duplicate_edges_are_merged(tmp_path):
+    path = write_edges(tmp_path, "1 2\n2 1 3\n1 2 3 0.8\n2 3\n")
+    topology = loader.parse_topology(path)
+
+    assert list(zip(topology["u"].tolist(), topology["v"].tolist())) == [(0, 1), (1, 2)]
+    assert topology["capacity"].tolist() == [3, -1]
+    assert topology["fidelity"][0] == 0.8
+
+def test_conflicting_duplicate_edges_raise(tmp_path):
+    with pytest.raises(ValueError):
+        loader.parse_topology(write_edges(tmp_path, "1 2 3\n2 1 4\n"))
+
+def test_self_loops_raise(tmp_path):
+    with pytest.raises(ValueError):
+        loader.parse_topology(write_edges(tmp_path, "1 1\n"))
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from QKDnet import Network
+from QKDnet.components.finder import KShortestPaths
+
+@pytest.fixture
+def network():
+    network = Network()
+    network.set_topology("Lattice", 3, 3)
+    return network
+
+def test_fidelity_is_updated_in_place(network):
+    channels, G, version = network.channels, network.G, network.topology_version
+    finder = KShortestPaths(network)
+    routes = finder.get_paths(0, 8)
+    route = network.get_route([0, 1, 2])
+    network.channels.load[:] = 1
+
+    network.set_fidelity(0.9)
+
+    # A topologia, os canais, a carga e as rotas calculadas são mantidos
+    assert network.channels is channels and network.G is G
+    assert network.topology_version == version
+    assert finder.get_paths(0, 8) is routes
+    assert network.get_route([0, 1, 2]) is route
+    assert np.all(channels.load == 1)
+    assert np.all(channels.fidelity == 0.9)
+    assert network.fidelity == 0.9
+    assert route.fidelity == pytest.approx(0.81)
+
+def test_fidelity_mask_changes_only_the_selected_channels(network):
+    mask = np.zeros(len(network.channels), dtype=bool)
+    mask[:4] = True
+
+    network.set_fidelity(0.7, mask)
+
+    assert np.all(network.channels.fidelity[mask] == 0.7)
+    assert np.all(network.channels.fidelity[~mask] == 1)
+    # Com máscara, o padrão da rede não muda
+    assert network.fidelity == 1
+    with pytest.raises(ValueError):
+        network.channels.fidelity[0] = 0.5
+
+def test_capacity_is_updated_in_place(network):
+    channels, version = network.channels, network.topology_version
+    route = network.get_route([0, 1, 2])
+    route.add_load()
+    assert not route.has_capacity()
+
+    network.set_capacity(2)
+    assert network.channels is channels and network.topology_version == version
+    assert network.capacity == 2
+    assert route.has_capacity()
+
+    network.set_capacity(1, route.edge_ids[:1])
+    assert network.capacity == 2
+    assert not route.has_capacity()
+    assert np.count_nonzero(channels.capacity == 1) == 1
+
+def test_restore_returns_to_the_snapshot(network):
+    snapshot = network.snapshot()
+    load = network.channels.load.copy()
+    eprs = network.channels.epr_available.copy()
+    qubits = dict(network.G.nodes(data="qubits_available"))
+
+    route = network.get_route([0, 1, 2])
+    route.add_load(3)
+    network.channels.epr_available[:] = 0
+    network.G.nodes[0]["qubits_available"] = 0
+
+    network.restore(snapshot)
+    assert np.array_equal(network.channels.load, load)
+    assert np.array_equal(network.channels.epr_available, eprs)
+    assert dict(network.G.nodes(data="qubits_available")) == qubits
+    # O estado guardado não é alterado pela rede
+    route.add_load()
+    assert np.array_equal(snapshot["load"], load)
+    network.restore(snapshot)
+    assert np.array_equal(network.channels.load, load)
+
+def test_snapshot_of_another_topology_is_rejected(network):
+    snapshot = network.snapshot()
+    network.set_topology("Lattice", 3, 3)
+    with pytest.raises(ValueError):
+        network.restore(snapshot)
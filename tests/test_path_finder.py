@@ -0,0 +1,71 @@
+import pytest
+from QKDnet import Network
+from QKDnet.components.finder import KShortestPaths, KLengthPaths, ShortestPaths
+
+@pytest.fixture
+def network():
+    network = Network()
+    network.set_topology("Lattice", 3, 3)
+    return network
+
+def test_routes_are_computed_once_per_pair(network):
+    finder = KShortestPaths(network)
+    routes = finder.get_paths(0, 8)
+
+    assert finder.get_paths(0, 8) is routes
+    assert isinstance(routes, tuple)
+    # Os parâmetros do buscador fazem parte da chave
+    finder.k = 1
+    assert finder.get_paths(0, 8) == routes[:1]
+
+def test_cache_is_dropped_when_the_topology_changes(network):
+    finder = KShortestPaths(network)
+    routes = finder.get_paths(0, 2)
+    assert routes[0] == (0, 1, 2)
+
+    # Mudar a fidelidade não invalida as rotas
+    network.set_fidelity(0.8)
+    assert finder.get_paths(0, 2) is routes
+
+    network.set_topology("Line", 3)
+    assert finder.get_paths(0, 2)[0] == (0, 1, 2)
+    assert finder.get_paths(0, 2) is not routes
+
+    network.set_backend("csr")
+    assert finder.get_paths(0, 2) is not routes
+
+def test_extra_arguments_are_cached_separately(network):
+    finder = KLengthPaths(network)
+    shortest = finder.get_paths(0, 2)
+    longer = finder.get_paths(0, 2, 4)
+
+    assert {len(route) for route in shortest} == {3}
+    assert {len(route) for route in longer} == {5}
+    assert finder.get_paths(0, 2, 4) is longer
+
+def test_disabled_cache_recomputes(network):
+    finder = KShortestPaths(network)
+    finder.use_cache = False
+    assert finder.get_paths(0, 8) == finder.get_paths(0, 8)
+    assert not finder.cache
+
+@pytest.mark.parametrize("finder_class", [ShortestPaths, KShortestPaths])
+def test_batch_queries_group_pairs_by_source(network, finder_class):
+    finder = finder_class(network)
+    calls = []
+    calculate_paths_from = finder.calculate_paths_from
+    def spy(alice, targets):
+        calls.append((alice, list(targets)))
+        return calculate_paths_from(alice, targets)
+    finder.calculate_paths_from = spy
+
+    finder.get_paths(0, 8)
+    pairs = [(0, 8), (0, 5), (0, 7), (3, 2), (0, 5), (4, 6), (4, 2)]
+    batch = finder.get_paths_many(pairs)
+
+    # O par já calculado e o repetido não são recalculados; (3, 2) tem um único destino e usa a busca por par
+    assert calls == [(0, [5, 7]), (4, [6, 2])]
+    assert set(batch) == set(pairs)
+    reference = finder_class(network)
+    assert all(batch[pair] == reference.get_paths(*pair) for pair in pairs)
+    assert all(finder.get_paths(*pair) is batch[pair] for pair in pairs)
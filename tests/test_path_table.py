@@ -0,0 +1,64 @@
+import os
+import numpy as np
+from QKDnet import Network
+from QKDnet.components.finder import KShortestPaths
+from QKDnet.components.finder.pathTable import PathTable, fingerprint
+
+def build_finder():
+    network = Network()
+    network.set_topology("Lattice", 3, 3)
+    return KShortestPaths(network)
+
+def test_path_table_round_trip(tmp_path):
+    nodes = [0, "R", 2]
+    paths = {(0, 2): [(0, "R", 2), (0, 2)], ("R", 0): [("R", 0)]}
+    file_name = str(tmp_path / "table.npy")
+    PathTable.from_paths(paths, nodes).save(file_name)
+
+    table = PathTable.load(file_name, nodes)
+    assert isinstance(table.data, np.memmap)
+    assert len(table) == 2
+    assert table.get(0, 2) == [(0, "R", 2), (0, 2)]
+    assert table.get("R", 0) == [("R", 0)]
+    assert table.get(2, 0) is None
+    assert table.get(0, "unknown") is None
+
+def test_build_table_reuses_the_file_on_disk(tmp_path):
+    finder = build_finder()
+    finder.build_table(cache_dir=str(tmp_path))
+    files = os.listdir(tmp_path)
+    assert len(files) == 1
+    expected = {(alice, bob): finder.get_paths(alice, bob) for alice, bob in [(0, 8), (4, 2), (7, 1)]}
+
+    # Outro buscador com a mesma topologia e parâmetros mapeia o arquivo ao invés de recalcular
+    other = build_finder()
+    other.build_table(cache_dir=str(tmp_path))
+    assert other.table is not None and not other.cache
+    assert {pair: other.get_paths(*pair) for pair in expected} == expected
+    assert os.listdir(tmp_path) == files
+
+def test_fingerprint_changes_with_topology_parameters_and_pairs():
+    finder = build_finder()
+    G = finder.network.G
+    base = fingerprint(G, finder)
+
+    finder.k = 2
+    assert fingerprint(G, finder) != base
+    finder.k = 5
+    assert fingerprint(G, finder) == base
+
+    assert fingerprint(G, finder, [(0, 8), (1, 2)]) == fingerprint(G, finder, [(1, 2), (0, 8)])
+    assert fingerprint(G, finder, [(0, 8)]) != base
+
+    finder.network.set_topology("Lattice", 3, 4)
+    assert fingerprint(finder.network.G, finder) != base
+
+def test_mismatched_table_is_not_reused(tmp_path):
+    finder = build_finder()
+    finder.build_table(cache_dir=str(tmp_path))
+
+    other = build_finder()
+    other.k = 1
+    other.build_table(cache_dir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 2
+    assert all(len(routes) == 1 for routes in [other.get_paths(0, 8), other.get_paths(3, 5)])
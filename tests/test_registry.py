@@ -0,0 +1,32 @@
+import pytest
+from QKDnet import BB84
+from QKDnet.protocols import get_protocol
+
+def test_shared_protocols_are_frozen():
+    protocol = get_protocol("BB84", "list")
+
+    with pytest.raises(ValueError):
+        protocol.set_mode("array")
+    with pytest.raises(ValueError):
+        protocol.mode = "statistical"
+
+    assert protocol.mode == "list"
+    assert get_protocol("BB84", "list") is protocol
+    assert get_protocol("BB84", "array").mode == "array"
+
+def test_own_instances_can_change_mode():
+    protocol = BB84()
+    protocol.set_mode("statistical")
+    assert protocol.mode == "statistical"
+
+def test_mode_is_normalized_before_caching():
+    protocol = get_protocol("BB84", "Array")
+    assert protocol is get_protocol("BB84", "array")
+    assert get_protocol("E91", "STATISTICAL") is get_protocol("E91", "statistical")
+    assert protocol.mode == "array"
+
+def test_invalid_app_or_mode_is_rejected():
+    with pytest.raises(ValueError):
+        get_protocol("BB84", "vector")
+    with pytest.raises(ValueError):
+        get_protocol("XYZ", "array")
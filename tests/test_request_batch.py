@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from QKDnet import Network, Simulation, Request
+
+@pytest.fixture
+def simulation():
+    network = Network()
+    network.set_topology("Lattice", 3, 3)
+    simulation = Simulation(network, None)
+    simulation.n_requests = 20000
+    return simulation
+
+@pytest.mark.parametrize("case", [1, 4, 7])
+def test_batch_follows_the_case_distribution(simulation, case):
+    np.random.seed(8)
+    simulation.case = case
+    batch = simulation.generate_request_batch()
+
+    assert len(batch) == 20000
+    expected = np.array(Simulation.CATEGORY_DISTRIBUTIONS[case]) / sum(Simulation.CATEGORY_DISTRIBUTIONS[case])
+    frequencies = np.bincount(batch.category, minlength=len(Simulation.CATEGORIES)) / len(batch)
+    assert np.allclose(frequencies, expected, atol=0.015)
+    assert np.allclose(np.bincount(batch.app) / len(batch), 1 / 3, atol=0.015)
+    assert batch.priority.min() >= 1 and batch.priority.max() <= 5
+    assert batch.max_time.min() >= 5 and batch.max_time.max() <= 15
+    assert np.all(batch.alice != batch.bob)
+
+def test_batch_builds_the_requests(simulation):
+    np.random.seed(8)
+    simulation.case = 2
+    batch = simulation.generate_request_batch(50)
+    requests = batch.to_requests()
+
+    assert len(requests) == 50 and all(isinstance(request, Request) for request in requests)
+    assert [request.num_id for request in requests] == list(range(50))
+    for i, request in enumerate(requests):
+        assert request.category == Simulation.CATEGORIES[batch.category[i]]
+        assert request.app == simulation.apps[batch.app[i]]
+        assert (request.alice, request.bob, request.priority) == (batch.alice[i], batch.bob[i], batch.priority[i])
+        assert request.protocol.mode == simulation.protocol_mode
+
+def test_invalid_case_is_rejected(simulation):
+    simulation.case = 10
+    with pytest.raises(ValueError):
+        simulation.generate_request_batch(1)
@@ -0,0 +1,124 @@
+import random
+import numpy as np
+import pytest
+from QKDnet import Network, Controller, Simulation
+from QKDnet.components.sorter import FifoSorter, UrgencySorter, ShortestRouteSorter, LongestRouteSorter, RequestQueue
+
+class FakeRequest:
+    """
+    Requisição com apenas os atributos usados pelos ordenadores.
+    """
+    def __init__(self, num_id):
+        self.num_id = num_id
+        self.max_time = random.randint(5, 10)
+        self.keys_need = random.choice([100, 250, 500])
+        self.route_length = random.randint(1, 4)
+        self.prepare()
+
+    def prepare(self):
+        # Valores pequenos e inteiros para forçar empates
+        self.estimated_time = 1 + self.keys_need // 250
+        self.max_start_time = self.max_time - self.estimated_time
+
+    def __repr__(self):
+        return f"FakeRequest({self.num_id})"
+
+@pytest.mark.parametrize("rekey", ["update", "refresh"])
+@pytest.mark.parametrize("sorter_class", [FifoSorter, UrgencySorter, ShortestRouteSorter, LongestRouteSorter])
+@pytest.mark.parametrize("seed", range(5))
+def test_queue_matches_sorting_in_arrival_order(sorter_class, seed, rekey):
+    random.seed(seed)
+    sorter = sorter_class()
+    queue = RequestQueue(sorter)
+    # Requisições ativas, na ordem de chegada: a fila deve ser sempre `sorter.sort` desta lista
+    reference = []
+    ids = iter(range(10 ** 6))
+
+    for _ in range(30):
+        # Atendimento parcial: as chaves que faltam mudam a urgência
+        for request in random.sample(reference, min(len(reference), 3)):
+            request.keys_need = max(request.keys_need - random.choice([50, 250]), 0)
+            request.prepare()
+            if rekey == "update":
+                queue.update(request)
+
+        # Requisições encerradas saem da fila
+        for request in random.sample(reference, min(len(reference), random.randint(0, 3))):
+            reference.remove(request)
+            queue.remove(request)
+
+        new = [FakeRequest(next(ids)) for _ in range(random.randint(0, 5))]
+        reference += new
+        if rekey == "refresh":
+            queue.refresh()
+        queue.push(new)
+
+        assert queue.copy() == sorter.sort(reference)
+        assert len(queue) == len(reference)
+
+def test_update_reinserts_only_changed_requests():
+    random.seed(0)
+    queue = RequestQueue(UrgencySorter())
+    requests = [FakeRequest(i) for i in range(5)]
+    queue.push(requests)
+    queue.copy()
+
+    # Sem mudança na chave, nada é reinserido
+    queue.update(requests[0])
+    assert not queue.pending and not queue.dead
+
+    requests[0].max_time = 0
+    requests[0].prepare()
+    queue.update(requests[0])
+    assert len(queue.pending) == 1 and queue.dead == 1
+    assert len(queue) == 5
+    assert queue.copy()[0] is requests[0]
+
+    queue.remove(requests[0])
+    with pytest.raises(ValueError):
+        queue.update(requests[0])
+
+def test_changing_the_sorter_breaks_ties_by_arrival():
+    random.seed(0)
+    requests = [FakeRequest(i) for i in range(20)]
+    queue = RequestQueue(UrgencySorter(), requests)
+    assert queue.copy() == UrgencySorter().sort(requests)
+
+    queue.set_sorter(FifoSorter())
+    assert queue.copy() == requests
+
+def test_controller_reprepares_only_what_changed():
+    random.seed(2)
+    np.random.seed(2)
+    network = Network()
+    network.set_topology("Lattice", 3, 3)
+    controller = Controller(network)
+    simulation = Simulation(network, controller)
+    simulation.set_case(3)
+    first, second, third = (simulation.generate_request_batch(10).to_requests() for _ in range(3))
+    for i, request in enumerate(first + second + third):
+        request.num_id = i
+
+    prepared = []
+    prepare_requests = controller.prepare_requests
+    def spy(requests):
+        prepared.append(list(requests))
+        prepare_requests(requests)
+    controller.prepare_requests = spy
+
+    controller.receive_requests(first)
+    # Chaves obtidas por uma requisição da fila, como em `send_requests`
+    changed = first[3]
+    changed.update_keys(changed.keys_need)
+    controller.changed_requests[id(changed)] = changed
+
+    controller.receive_requests(second)
+    assert prepared[1] == [changed] + second
+    assert changed.estimated_time == 1
+    assert controller.requests.copy() == UrgencySorter().sort(first + second)
+
+    # Com outra rede (aqui, outro número de qubits), toda a fila é estimada novamente
+    network.set_nqubits(50)
+    controller.receive_requests(third)
+    assert len(prepared[2]) == 30 and set(prepared[2]) == set(first + second + third)
+    assert controller.requests.copy() == UrgencySorter().sort(first + second + third)
@@ -0,0 +1,69 @@
+import random
+import numpy as np
+import pytest
+from QKDnet import Network, Controller, Simulation, Request
+from QKDnet.request import RequestRegistry
+
+def build_requests(n, first_id=0):
+    return [Request(first_id + i, "Category A", "BB84", 1, 10, 0, 1) for i in range(n)]
+
+def test_add_and_finish():
+    registry = RequestRegistry()
+    assert registry.all_finished() and len(registry) == 0
+
+    requests = build_requests(3)
+    registry.add(requests)
+    assert not registry.all_finished() and len(registry) == 3
+    assert registry.get(1) is requests[1] and requests[1] in registry
+    assert registry.get(7) is None
+
+    registry.finish(requests[1])
+    assert requests[1].finished and requests[1] not in registry
+    assert registry.get(1) is None
+    assert registry.finished == 1 and len(registry) == 2
+
+    for request in (requests[0], requests[2]):
+        registry.finish(request)
+    assert registry.all_finished() and registry.finished == 3
+
+def test_finishing_twice_is_an_error():
+    registry = RequestRegistry()
+    request = build_requests(1)[0]
+    registry.add([request])
+    registry.finish(request)
+
+    with pytest.raises(KeyError):
+        registry.finish(request)
+    assert registry.finished == 1
+
+def test_ids_are_unique_among_active_requests():
+    registry = RequestRegistry()
+    first = build_requests(2)
+    registry.add(first)
+    with pytest.raises(ValueError):
+        registry.add(build_requests(1, first_id=1))
+
+    # Um id volta a ficar livre quando a requisição é encerrada
+    registry.finish(first[1])
+    other = build_requests(1, first_id=1)[0]
+    registry.add([other])
+    assert registry.get(1) is other
+    # A requisição encerrada com o mesmo id não é confundida com a ativa
+    assert first[1] not in registry
+
+def test_simulation_finishes_every_request():
+    random.seed(5)
+    np.random.seed(5)
+    network = Network()
+    network.set_topology("Lattice", 3, 3)
+    controller = Controller(network)
+    simulation = Simulation(network, controller)
+    simulation.set_case(2)
+    simulation.set_n_requests(20)
+    simulation.run()
+
+    assert controller.registry.all_finished()
+    assert controller.registry.finished == 20
+    assert all(request.finished for request in simulation.requests)
+    served, failed = controller.data_base.served_requests, controller.data_base.failed_requests
+    assert len(served) + len(failed) == 20
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from QKDnet import Network
+
+@pytest.fixture
+def network():
+    network = Network()
+    network.set_topology("Lattice", 3, 3)
+    network.set_fidelity(0.9)
+    return network
+
+def test_routes_are_interned(network):
+    route = network.get_route([0, 1, 2])
+    assert network.get_route((0, 1, 2)) is route
+    assert route == (0, 1, 2)
+    assert route.hops == 2
+
+def test_routes_are_immutable(network):
+    route = network.get_route([0, 1, 2])
+    with pytest.raises(AttributeError):
+        route.edge_ids = np.array([0])
+    with pytest.raises(AttributeError):
+        route.extra = 1
+    with pytest.raises(AttributeError):
+        del route.channels
+    with pytest.raises(ValueError):
+        route.edge_ids[0] = 0
+
+def test_route_fidelity_follows_channel_updates(network):
+    route = network.get_route([0, 1, 2])
+    assert route.fidelity == pytest.approx(0.81)
+    assert route.flip_probability == pytest.approx((1 - 0.8 ** 2) / 2)
+
+    network.set_fidelity(0.5, route.edge_ids[:1])
+    assert route.fidelity == pytest.approx(0.45)
+    assert route.flip_probability == pytest.approx(0.5)
@@ -0,0 +1,59 @@
+import networkx as nx
+import numpy as np
+import pytest
+from QKDnet import Network
+
+@pytest.fixture
+def network():
+    network = Network()
+    network.set_topology("Lattice", 3, 3)
+    return network
+
+def test_pairs_have_distinct_endpoints(network):
+    np.random.seed(2)
+    alice, bob = network.sample_pairs(5000)
+
+    assert len(alice) == len(bob) == 5000
+    assert np.all(alice != bob)
+    assert set(alice) == set(bob) == set(network.G.nodes)
+    # Pares uniformes: cada um dos 9 * 8 pares ordenados aparece
+    assert len(set(zip(alice, bob))) == 72
+
+def test_relays_are_not_endpoints():
+    np.random.seed(2)
+    G = nx.Graph([(0, "R1"), ("R1", 1), (1, "R2"), ("R2", 2)])
+    network = Network()
+    network.assign_to_net(G)
+
+    alice, bob = network.sample_pairs(500)
+    assert set(network.endpoints) == {0, 1, 2}
+    assert set(alice) | set(bob) == {0, 1, 2}
+    assert all(isinstance(node, int) for node in network.random_alice_bob())
+
+def test_traffic_matrix_selects_the_pairs(network):
+    np.random.seed(2)
+    k = len(network.endpoints)
+    matrix = np.zeros((k, k))
+    matrix[0, 4] = 3
+    matrix[4, 0] = 1
+    # A diagonal é ignorada
+    matrix[2, 2] = 100
+
+    alice, bob = network.sample_pairs(4000, matrix)
+    pairs = list(zip(alice, bob))
+    expected = (network.endpoints[0], network.endpoints[4])
+    assert set(pairs) == {expected, expected[::-1]}
+    assert pairs.count(expected) / len(pairs) == pytest.approx(0.75, abs=0.03)
+
+def test_invalid_traffic_matrices(network):
+    k = len(network.endpoints)
+    with pytest.raises(ValueError):
+        network.sample_pairs(1, np.ones((k - 1, k - 1)))
+    with pytest.raises(ValueError):
+        network.sample_pairs(1, np.eye(k))
+
+def test_a_single_endpoint_cannot_form_a_pair():
+    network = Network()
+    network.assign_to_net(nx.Graph([(0, "R1")]))
+    with pytest.raises(ValueError):
+        network.random_alice_bob()
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from QKDnet.utils import sparse_flip_indices, AliasTable
+
+# Repetições por teste
+RUNS = 4000
+
+@pytest.mark.parametrize("size, probability", [(1000, 0.002), (200, 0.05), (50, 0.3)])
+def test_sparse_flip_indices_matches_dense_sampling(size, probability):
+    np.random.seed(5)
+    counts = np.zeros(size)
+    totals = []
+    for _ in range(RUNS):
+        indices = sparse_flip_indices(size, probability)
+        # Posições válidas, distintas e em ordem crescente
+        assert np.all(np.diff(indices) > 0)
+        assert len(indices) == 0 or (indices[0] >= 0 and indices[-1] < size)
+        counts[indices] += 1
+        totals.append(len(indices))
+
+    # Número de ocorrências: Binomial(size, probability), como a máscara densa `random(size) < probability`
+    mean, var = size * probability, size * probability * (1 - probability)
+    assert abs(np.mean(totals) - mean) < 4 * np.sqrt(var / RUNS)
+    assert 0.85 < np.var(totals) / var < 1.15
+    # Todas as posições têm a mesma probabilidade (o primeiro e o último terço não diferem)
+    third = size // 3
+    first, last = counts[:third].mean(), counts[-third:].mean()
+    assert abs(first - last) < 4 * np.sqrt(RUNS * probability / third) + 1e-9
+
+def test_sparse_flip_indices_edge_cases():
+    assert len(sparse_flip_indices(0, 0.5)) == 0
+    assert len(sparse_flip_indices(100, 0)) == 0
+    assert sparse_flip_indices(5, 1).tolist() == [0, 1, 2, 3, 4]
+
+@pytest.mark.parametrize("weights", [[0.3, 0.3, 0.2, 0.15, 0.05], [0, 1, 0], [5, 1, 0, 2], [1]])
+def test_alias_table_frequencies_match_the_weights(weights):
+    np.random.seed(5)
+    probabilities = np.array(weights) / np.sum(weights)
+    table = AliasTable(weights)
+    samples = table.sample(100000)
+
+    assert len(table) == len(weights)
+    frequencies = np.bincount(samples, minlength=len(weights)) / len(samples)
+    assert np.allclose(frequencies, probabilities, atol=0.01)
+    # Categorias de peso zero nunca são sorteadas
+    assert np.all(frequencies[probabilities == 0] == 0)
+
+@pytest.mark.parametrize("weights", [[], [0, 0], [1, -1], [[1, 2]]])
+def test_alias_table_rejects_invalid_weights(weights):
+    with pytest.raises(ValueError):
+        AliasTable(weights)
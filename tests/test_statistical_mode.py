@@ -0,0 +1,49 @@
+import random
+import numpy as np
+import pytest
+from QKDnet import Network, BB84, E91, B92
+
+# Execuções por modo, qubits por execução e nível de significância do teste KS
+RUNS = 300
+NQUBITS = 200
+ALPHA = 0.001
+ROUTE = [0, 1, 2, 5]
+
+@pytest.fixture
+def network():
+    random.seed(7)
+    np.random.seed(7)
+    network = Network()
+    network.set_topology("Lattice", 3, 3)
+    network.set_fidelity(0.9)
+    network.set_nqubits(NQUBITS)
+    return network
+
+def key_lengths(protocol_class, mode, network):
+    protocol = protocol_class()
+    protocol.set_mode(mode)
+    return np.array([protocol.run(network, ROUTE).shared_length for _ in range(RUNS)])
+
+def ks_statistic(a, b):
+    values = np.union1d(a, b)
+    cdf_a = np.searchsorted(np.sort(a), values, side="right") / len(a)
+    cdf_b = np.searchsorted(np.sort(b), values, side="right") / len(b)
+    return np.abs(cdf_a - cdf_b).max()
+
+def ks_critical(n, m):
+    return np.sqrt(-np.log(ALPHA / 2) / 2) * np.sqrt((n + m) / (n * m))
+
+@pytest.mark.parametrize("protocol_class", [BB84, E91, B92])
+def test_statistical_mode_matches_simulated_modes(protocol_class, network):
+    expected = NQUBITS * protocol_class().key_yield(network.route_flip_probability(ROUTE))
+    statistical = key_lengths(protocol_class, "statistical", network)
+
+    for mode in ("list", "array"):
+        simulated = key_lengths(protocol_class, mode, network)
+        # Médias dentro de 4 erros padrão do valor esperado
+        for lengths in (simulated, statistical):
+            assert abs(lengths.mean() - expected) < 4 * lengths.std() / np.sqrt(RUNS)
+        # Variâncias compatíveis
+        assert 0.7 < simulated.var() / statistical.var() < 1.4
+        # Mesma distribuição
+        assert ks_statistic(simulated, statistical) < ks_critical(RUNS, RUNS)